@@ -12,26 +12,458 @@ Run: pip install -r py_scripts/requirements.txt
        python py_scripts/gui.py
 
 """
+import os
+import re
 import sys
 import json
 import threading
 from queue import Queue, Empty
+from collections import deque
+from contextlib import contextmanager
+from itertools import count
 import time
 from pathlib import Path
 
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-                               QPushButton, QComboBox, QLabel, QLineEdit, QTextEdit,
+                               QPushButton, QComboBox, QLabel, QLineEdit, QPlainTextEdit,
                                QTreeWidget, QTreeWidgetItem, QMessageBox, QCheckBox,
-                               QTableWidget, QTableWidgetItem, QInputDialog, QAbstractItemView, QSplitter)
-from PySide6.QtCore import Qt, QTimer, QEvent
+                               QTableView, QInputDialog, QAbstractItemView, QSplitter)
+from PySide6.QtCore import Qt, QTimer, QEvent, Signal, QAbstractTableModel, QModelIndex, QSocketNotifier
 from PySide6.QtGui import QColor
 
 import serial
 import serial.tools.list_ports
 
+# orjson parses/serializes the serial traffic and the config file several times faster
+# than the stdlib; fall back to json when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps_line(obj):
+        return orjson.dumps(obj) + b'\n'
+else:
+    _loads = json.loads
+
+    def _dumps_line(obj):
+        return (json.dumps(obj, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def _dumps_config(cfg):
+    # indented UTF-8 bytes for gui_config.json, written with a single write_bytes
+    if orjson is not None:
+        return orjson.dumps(cfg, option=orjson.OPT_INDENT_2)
+    return json.dumps(cfg, indent=2).encode('utf-8')
+
+
+@contextmanager
+def _bulk_update(widget):
+    """Suspend repaints of `widget` around a run of structural changes (many rows or
+    items removed/added one by one). Re-enabling repaints the whole widget, so this is
+    not for value updates, which Qt already repaints cell by cell. Nested uses leave
+    re-enabling to the outermost one.
+    """
+    if not widget.updatesEnabled():
+        yield
+        return
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+_decoder = json.JSONDecoder()
+_ws = json.decoder.WHITESPACE
+
+
+def _split_frames(text):
+    """Split a line holding several concatenated JSON values ('{..}{..}') into
+    (frame_text, obj) pairs using raw_decode. Returns [] if any part is malformed.
+    """
+    frames = []
+    idx = _ws.match(text, 0).end()
+    n = len(text)
+    while idx < n:
+        try:
+            obj, end = _decoder.raw_decode(text, idx)
+        except ValueError:
+            return []
+        frames.append((text[idx:end], obj))
+        idx = _ws.match(text, end).end()
+    return frames
+
+
+def _copy_message(msg):
+    # copy of a parsed message whose state/update payload dict can be handed to the cache
+    msg = dict(msg)
+    for key in ('value', 'changes'):
+        payload = msg.get(key)
+        if isinstance(payload, dict):
+            msg[key] = dict(payload)
+    return msg
+
+def _fmt_value(v):
+    # display text for a field value; floats use a fixed 6 significant digits, which is
+    # cheaper than str()'s shortest-repr search and keeps noisy readings from churning the cell.
+    # Display only: editors are given the exact str() so an untouched value is not rounded
+    if type(v) is float:
+        return f'{v:.6g}'
+    if type(v) is str:
+        return v
+    return str(v)
+
+# classify edited cell text once instead of trying int()/float() and catching failures
+_INT_RE = re.compile(r'[-+]?\d+')
+_FLOAT_RE = re.compile(r'[-+]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?')
+_LITERALS = {'true': True, 'false': False, 'null': None}
+# foreground for unsolicited (not subscribed) object tree entries; same as QColor('gray')
+_GRAY = QColor(128, 128, 128)
+# QTreeWidgetItem's default flags plus ItemIsEditable, for field items whose value can be edited
+_LEAF_FLAGS = (Qt.ItemIsSelectable | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+               | Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled | Qt.ItemIsEditable)
+# item data role holding the owning object's name on field items (see _object_name)
+_OBJ_ROLE = Qt.UserRole + 1
+# item data role holding a field item's exact value; column 1 only shows it rounded (_fmt_value)
+_VALUE_ROLE = Qt.UserRole + 2
+
 CONFIG_PATH = Path(__file__).parent / "gui_config.json"
+# number of (timestamp, value) samples kept per object field
+HISTORY_CAP = 4096
+HISTORY_TIME_FMT = '%Y-%m-%d %H:%M:%S'
+# queued outgoing bytes that force an immediate write instead of waiting for the event loop
+TX_FLUSH_BYTES = 4096
+# received lines handled per event-loop pass; the rest wait for the next pass so the
+# GUI keeps painting during bursts
+RX_BATCH_MAX = 64
+# _send_batch splits its messages into writes of at most this many bytes, one per
+# TX_PACE_MS tick; the ESP8266's UART RX FIFO is ~256 bytes and the firmware replies
+# with blocking prints, so a large burst would be dropped
+TX_PACED_BYTES = 200
+TX_PACE_MS = 50
+
+class ExprTableModel(QAbstractTableModel):
+    """Expressions table (Glyph | Expression | Type | Value) stored column-wise.
+
+    Each row is a top-level expression, an inline field row of an expanded expression
+    (parents[r] holds the expression name, keys[r] the field) or the trailing
+    'Add expression' placeholder (keys[r] == ''). Programmatic setters only emit
+    dataChanged; edits made through the view additionally emit cellEdited(row, col).
+    Field Value cells display a rounded value; the editor gets the exact cached value
+    from `states` (the window's cache['states']).
+    """
+    cellEdited = Signal(int, int)
+
+    HEADERS = ('', 'Expression', 'Type', 'Value')
+    FIELD_BG = QColor('#2b2b2b')
+    FIELD_FG = QColor('#e6e6e6')
+    # flags() runs for every painted cell; combine the flag values once
+    READONLY_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    EDITABLE_FLAGS = READONLY_FLAGS | Qt.ItemIsEditable
+    PLACEHOLDER_FLAGS = Qt.ItemIsEnabled
+    PLACEHOLDER_EDIT_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def __init__(self, parent=None, states=None):
+        super().__init__(parent)
+        self.states = {} if states is None else states
+        # one list per column plus per-row metadata; row tuples are (glyph, text, type, value, key, parent)
+        self.glyphs = []
+        self.texts = []
+        self.types = []
+        self.values = []
+        self.keys = []
+        self.parents = []
+        self._columns = (self.glyphs, self.texts, self.types, self.values)
+        # expression name -> row, rebuilt lazily after structural edits
+        self._expr_index = {}
+        self._expr_index_dirty = True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.texts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 4
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        r = index.row()
+        c = index.column()
+        if role == Qt.DisplayRole:
+            if c == 1 and self.parents[r] is not None:
+                # indent field names under their expression
+                return '  ' + self.texts[r]
+            return self._columns[c][r]
+        if role == Qt.EditRole:
+            if c == 3 and self.parents[r] is not None:
+                return self._field_edit_text(r)
+            return self._columns[c][r]
+        if self.parents[r] is not None:
+            if role == Qt.BackgroundRole:
+                return self.FIELD_BG
+            if role == Qt.ForegroundRole:
+                return self.FIELD_FG
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        r = index.row()
+        c = index.column()
+        if r == self.placeholder_row():
+            # placeholder: only the Expression cell can be edited to add a new expression
+            return self.PLACEHOLDER_EDIT_FLAGS if c == 1 else self.PLACEHOLDER_FLAGS
+        if self.parents[r] is not None:
+            return self.EDITABLE_FLAGS if c == 3 else self.READONLY_FLAGS
+        return self.EDITABLE_FLAGS if c == 1 else self.READONLY_FLAGS
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not (self.flags(index) & Qt.ItemIsEditable):
+            return False
+        r = index.row()
+        c = index.column()
+        text = '' if value is None else str(value)
+        # closing an editor without changing the text is not an edit (QTableWidget's
+        # itemChanged did not fire for it either)
+        if text == self.data(index, Qt.EditRole):
+            return False
+        self._columns[c][r] = text
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.cellEdited.emit(r, c)
+        return True
+
+    def _field_edit_text(self, r):
+        # exact text of a field row's cached value, as long as the cell still shows that
+        # value; text the user typed (shown until the next state arrives) is returned as is
+        text = self.values[r]
+        state = self.states.get(self.parents[r])
+        key = self.keys[r]
+        if isinstance(state, dict):
+            if key not in state:
+                return text
+            v = state[key]
+        elif key == '<value>':
+            v = state
+        else:
+            return text
+        return str(v) if _fmt_value(v) == text else text
+
+    # --- programmatic API (no cellEdited) ---
+    def placeholder_row(self):
+        """Row of the trailing 'Add expression' placeholder (-1 while the table is empty)."""
+        return len(self.texts) - 1
+
+    @staticmethod
+    def expr_row(name, typ='object', value=''):
+        """Row tuple for a collapsed top-level expression."""
+        return ('▶', name, typ, value, name, None)
+
+    def is_field(self, row):
+        return self.parents[row] is not None
+
+    def field_span(self, row):
+        """Number of field rows directly below `row`."""
+        i = row + 1
+        n = len(self.parents)
+        while i < n and self.parents[i] is not None:
+            i += 1
+        return i - row - 1
+
+    def find_expr(self, name):
+        if self._expr_index_dirty:
+            index = {}
+            for r, key in enumerate(self.keys):
+                if key and self.parents[r] is None and key not in index:
+                    index[key] = r
+            self._expr_index = index
+            self._expr_index_dirty = False
+        return self._expr_index.get(name)
+
+    def insert_rows(self, at, rows):
+        """Insert row tuples (glyph, text, type, value, key, parent) before `at`."""
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), at, at + len(rows) - 1)
+        for lst, col in zip((self.glyphs, self.texts, self.types, self.values, self.keys, self.parents), zip(*rows)):
+            lst[at:at] = col
+        self._expr_index_dirty = True
+        self.endInsertRows()
+
+    def remove_rows(self, at, count):
+        if count <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), at, at + count - 1)
+        for lst in (self.glyphs, self.texts, self.types, self.values, self.keys, self.parents):
+            del lst[at:at + count]
+        self._expr_index_dirty = True
+        self.endRemoveRows()
+
+    def replace_rows(self, at, count, rows):
+        """Replace the `count` rows starting at `at` with row tuples.
+        Rows present before and after are overwritten in place (one dataChanged);
+        only the difference in length is inserted or removed.
+        """
+        keep = min(count, len(rows))
+        if keep:
+            for lst, col in zip((self.glyphs, self.texts, self.types, self.values, self.keys, self.parents), zip(*rows[:keep])):
+                lst[at:at + keep] = col
+            self._expr_index_dirty = True
+            self.dataChanged.emit(self.index(at, 0), self.index(at + keep - 1, 3), [Qt.DisplayRole])
+        if len(rows) > count:
+            self.insert_rows(at + keep, rows[keep:])
+        elif count > keep:
+            self.remove_rows(at + keep, count - keep)
+
+    def set_cell(self, row, col, text):
+        lst = self._columns[col]
+        if lst[row] != text:
+            lst[row] = text
+            idx = self.index(row, col)
+            self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+    def set_column_span(self, first, col, texts):
+        """Write consecutive cells of one column.
+        Cells whose text is unchanged are skipped; each run of changed cells is announced
+        with one dataChanged so static fields between them are not repainted.
+        """
+        lst = self._columns[col]
+        run = None
+        for i, text in enumerate(texts, first):
+            if lst[i] != text:
+                lst[i] = text
+                if run is None:
+                    run = i
+            elif run is not None:
+                self.dataChanged.emit(self.index(run, col), self.index(i - 1, col), [Qt.DisplayRole])
+                run = None
+        if run is not None:
+            self.dataChanged.emit(self.index(run, col), self.index(first + len(texts) - 1, col), [Qt.DisplayRole])
+
+    def set_key(self, row, key):
+        self.keys[row] = key
+        self._expr_index_dirty = True
+
+class DictModel(QAbstractTableModel):
+    """Two-column (Field, Value) view of one object's cached state for the object dialog.
+    The state is referenced, not copied; cells are formatted only when the view paints them.
+    Edits to a value emit valueEdited(field, text) and show the typed text until the next
+    state arrives. Values display rounded (_fmt_value) but are edited exactly.
+    """
+    valueEdited = Signal(str, str)
+
+    HEADERS = ('Field', 'Value')
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys = ()
+        self._row_by_key = {}
+        self._state = None
+        self._edited = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        k = self._keys[index.row()]
+        if index.column() == 0:
+            return str(k)
+        if k in self._edited:
+            return self._edited[k]
+        v = self._state.get(k, '') if isinstance(self._state, dict) else self._state
+        return _fmt_value(v) if role == Qt.DisplayRole else str(v)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 1:
+            return ExprTableModel.EDITABLE_FLAGS
+        return ExprTableModel.READONLY_FLAGS
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or index.column() != 1:
+            return False
+        k = self._keys[index.row()]
+        text = '' if value is None else str(value)
+        # an editor closed without changing the value is not an edit
+        if text == self.data(index, Qt.EditRole):
+            return False
+        self._edited[k] = text
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.valueEdited.emit(str(k), text)
+        return True
+
+    def key(self, row):
+        return self._keys[row]
+
+    def set_state(self, state, keys, changed=None):
+        """Show `state` with rows in sorted `keys` order.
+        Keys that appeared or disappeared insert/remove only their own rows. When `changed`
+        (the keys whose values changed) is given only those rows are repainted, otherwise
+        the whole Value column is.
+        """
+        self._state = state
+        old = self._keys
+        if keys != old:
+            keep = set(keys)
+            for r in range(len(old) - 1, -1, -1):
+                if old[r] not in keep:
+                    self._edited.pop(old[r], None)
+                    self.beginRemoveRows(QModelIndex(), r, r)
+                    self._keys = self._keys[:r] + self._keys[r + 1:]
+                    self.endRemoveRows()
+            had = set(old)
+            # both key lists are sorted, so each new key goes in at its final position
+            for r, k in enumerate(keys):
+                if k not in had:
+                    self.beginInsertRows(QModelIndex(), r, r)
+                    self._keys = self._keys[:r] + (k,) + self._keys[r:]
+                    self.endInsertRows()
+            self._keys = keys
+            self._row_by_key = {k: r for r, k in enumerate(keys)}
+        if changed is None:
+            self._edited.clear()
+            if keys:
+                self.dataChanged.emit(self.index(0, 1), self.index(len(keys) - 1, 1), [Qt.DisplayRole])
+            return
+        rows = []
+        row_by_key = self._row_by_key
+        for k in changed:
+            r = row_by_key.get(k)
+            if r is not None:
+                self._edited.pop(k, None)
+                rows.append(r)
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 1), self.index(max(rows), 1), [Qt.DisplayRole])
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._keys = self._keys[:row] + self._keys[row + 1:]
+        self._row_by_key = {k: r for r, k in enumerate(self._keys)}
+        self.endRemoveRows()
 
 class LiveWatchGUI(QWidget):
+    # emitted from the reader thread once a complete line has been queued
+    _incoming_ready = Signal()
+    # emitted by _log when the first line of a batch is buffered (any thread)
+    _log_ready = Signal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle('LiveWatch - Object Inspector')
@@ -40,6 +472,9 @@ class LiveWatchGUI(QWidget):
         self.ser = None
         self.reader_thread = None
         self.reader_running = False
+        # on POSIX the port fd is watched by the Qt event loop instead of a reader thread
+        self._rx_notifier = None
+        self._rx_buf = bytearray()
 
         self.cache = {
             'schemas': {},
@@ -47,24 +482,71 @@ class LiveWatchGUI(QWidget):
         }
         # count of previously saved expressions (from config) shown in placeholder
         self.past_expr_count = 0
-        # map of object name -> expiry timestamp for recently requested info
+        # placeholder row text, formatted once rather than on every placeholder refresh
+        self._ph_text = 'Add expression'
+        # map of object name -> expiry time (time.monotonic) for recently requested info;
+        # expired entries are dropped by _expire_expecting
         self.expecting = {}
         # open dialogs for object drill-down: name -> {dialog, table, update}
         self.open_object_dialogs = {}
         # track which expressions are expanded inline
         self.expanded_exprs = set()
+        # object name -> top-level QTreeWidgetItem of the object tree
+        self._tree_index = {}
+        # object name -> {field name: child QTreeWidgetItem} for the items above; _show_schema
+        # replaces an object's children and re-indexes them, nothing else removes field items
+        self._tree_fields = {}
+        # objects whose tree entry has been expanded once; later states keep the user's expansion
+        self._tree_expanded = set()
+        # (object, array field) -> first element shown; moved by the 'Load more'/'Show previous' items
+        self._array_windows = {}
+        # set while device data is written into the tree so on_item_changed does not echo it back
+        self._applying_server_update = False
+        # request ids stamped on outgoing messages by _send; the device echoes them back
+        self._msg_ids = count(1)
+        # expanded expressions whose inline rows need a refresh, flushed by _flush_expanded
+        self._dirty_expanded = set()
+        self._refresh_scheduled = False
+        # last state/update line per object, so a steady device's repeats skip the JSON parse:
+        # raw line -> [object name, parsed message or None], and object name -> its last line
+        self._repeat_lines = {}
+        self._last_line = {}
+        # (fn, args) to run after the current batch of payloads is merged, see _after_merge
+        self._post_merge = []
+        # object name -> (key set, sorted key tuple) of its dict state, see _sorted_keys_for
+        self._sorted_keys = {}
         # subscription handling: only accept unsolicited updates for subscribed objects
+        # mutate through _add_sub/_remove_sub; readers on the RX path use the frozenset
+        # snapshot from _subscribed(), rebuilt only after a change
         self.subscriptions = set()
+        self._subs_snapshot = None
         self.require_subscription = True
+        # config write requested but not yet done (see _schedule_save)
+        self._save_pending = False
+        # append raw RX/TX lines to the log window (mirrors log_rx_chk)
+        self.log_traffic = True
+        # log lines buffered by _log and appended to the widget at most every 100 ms
+        self._log_lines = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_ready.connect(self._log_timer.start, Qt.QueuedConnection)
         # requests to send once serial connection established (list of (type, name))
         self._pending_startup_requests = []
+        # outgoing messages queued by _send and written together by _flush_tx
+        self._tx_buf = bytearray()
+        self._tx_flush_scheduled = False
+        # messages waiting for their paced write, see _send_batch
+        self._paced_msgs = deque()
+        self._pace_scheduled = False
         # queue for lines read from serial (processed in GUI thread)
         self._incoming_queue = Queue()
-        # timer to process incoming serial lines on the GUI thread
-        self._process_timer = QTimer(self)
-        self._process_timer.setInterval(25)
-        self._process_timer.timeout.connect(self._process_incoming)
-        self._process_timer.start()
+        # the reader thread signals as soon as a line is queued; the queued connection runs
+        # _process_incoming on the GUI thread without any polling timer. While one
+        # notification is pending the reader does not post another (see _rx_notify_pending).
+        self._rx_notify_pending = False
+        self._incoming_ready.connect(self._process_incoming, Qt.QueuedConnection)
 
         self._build_ui()
         self._load_config()
@@ -76,6 +558,12 @@ class LiveWatchGUI(QWidget):
         self.port_timer.timeout.connect(self._populate_ports)
         self.port_timer.start()
 
+        # sweep expired 'expecting' windows once a second
+        self.expect_timer = QTimer(self)
+        self.expect_timer.setInterval(1000)
+        self.expect_timer.timeout.connect(self._expire_expecting)
+        self.expect_timer.start()
+
     def _build_ui(self):
         # Use a splitter so user can resize top (controls + table) and bottom (log)
         main_layout = QVBoxLayout(self)
@@ -100,8 +588,9 @@ class LiveWatchGUI(QWidget):
         top_layout.addLayout(h)
 
         # expressions table (Glyph | Expression | Type | Value)
-        self.expr_table = QTableWidget(0, 4)
-        self.expr_table.setHorizontalHeaderLabels(['', 'Expression', 'Type', 'Value'])
+        self._expr_model = ExprTableModel(self, self.cache['states'])
+        self.expr_table = QTableView()
+        self.expr_table.setModel(self._expr_model)
         self.expr_table.verticalHeader().setVisible(False)
         self.expr_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         # allow inline editing of the Expression column (Excel-like)
@@ -122,10 +611,10 @@ class LiveWatchGUI(QWidget):
         self.expr_table.resizeRowsToContents()
         # add placeholder row and wire handlers
         self._add_expr_placeholder()
-        self.expr_table.cellDoubleClicked.connect(self.on_expr_double_clicked)
+        self.expr_table.doubleClicked.connect(lambda idx: self.on_expr_double_clicked(idx.row(), idx.column()))
         # single-click on glyph column should toggle expand/collapse without editing the Expression cell
-        self.expr_table.cellClicked.connect(self.on_expr_cell_clicked)
-        self.expr_table.cellChanged.connect(self.on_expr_cell_changed)
+        self.expr_table.clicked.connect(lambda idx: self.on_expr_cell_clicked(idx.row(), idx.column()))
+        self._expr_model.cellEdited.connect(self.on_expr_cell_changed)
         self.expr_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.expr_table.customContextMenuRequested.connect(self.on_expr_context_menu)
         # allow Delete key handling via event filter
@@ -146,12 +635,16 @@ class LiveWatchGUI(QWidget):
         self.unsubscribe_btn.clicked.connect(self.on_unsubscribe)
         self.require_sub_chk = QCheckBox('Require subscription for unsolicited updates')
         self.require_sub_chk.setChecked(True)
+        self.log_rx_chk = QCheckBox('Log RX/TX')
+        self.log_rx_chk.setChecked(self.log_traffic)
+        self.log_rx_chk.toggled.connect(self._on_log_traffic_toggled)
         h2.addWidget(self.object_input)
         h2.addWidget(self.discover_btn)
         h2.addWidget(self.add_btn)
         h2.addWidget(self.subscribe_btn)
         h2.addWidget(self.unsubscribe_btn)
         h2.addWidget(self.require_sub_chk)
+        h2.addWidget(self.log_rx_chk)
         top_layout.addLayout(h2)
 
         splitter.addWidget(top_widget)
@@ -159,7 +652,7 @@ class LiveWatchGUI(QWidget):
     # (filter removed per user request)
 
         # lower: raw log (we no longer show the object/field tree)
-        self.log = QTextEdit()
+        self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
         splitter.addWidget(self.log)
         # style the splitter handle to be easier to grab
@@ -173,214 +666,132 @@ class LiveWatchGUI(QWidget):
         self.setLayout(main_layout)
 
     def _log(self, *parts):
-        s = ' '.join(str(p) for p in parts)
-        self.log.append(s)
+        # buffer the line; the widget is updated in one append per 100 ms (see _flush_log)
+        lines = self._log_lines
+        lines.append(' '.join(str(p) for p in parts))
+        if len(lines) == 1:
+            self._log_ready.emit()
+
+    def _flush_log(self):
+        lines, self._log_lines = self._log_lines, []
+        if not lines:
+            return
+        # plain text: QTextEdit.append guessed rich text from the first line, so one tag-like
+        # value turned the whole batch into HTML
+        self.log.appendPlainText('\n'.join(lines))
+
+    def _on_log_traffic_toggled(self, on):
+        # cached so the RX/TX paths test a plain attribute instead of calling into Qt
+        self.log_traffic = on
 
     def eventFilter(self, obj, event):
         # intercept Delete key on the expressions table to remove top-level expressions
-        try:
-            if obj is self.expr_table and event.type() == QEvent.KeyPress:
-                from PySide6.QtGui import QKeyEvent
-                key = event.key()
-                if key == Qt.Key_Delete:
-                    sel = self.expr_table.selectionModel().selectedRows()
-                    if not sel:
-                        return False
-                    # map selected rows to top-level expression rows (if user selected a field row)
-                    rows = []
-                    for s in sel:
-                        r0 = s.row()
-                        try:
-                            meta = self.expr_table.item(r0, 1).data(Qt.UserRole)
-                        except Exception:
-                            meta = None
-                        if isinstance(meta, dict) and meta.get('isField'):
-                            parent = meta.get('parent')
-                            prow = self._find_expr_row(parent)
-                            if prow is not None:
-                                rows.append(prow)
-                        else:
-                            rows.append(r0)
-                    # deduplicate and sort descending so row indices remain valid while removing
-                    rows = sorted(set(rows), reverse=True)
-                    for r in rows:
-                        try:
-                            self._remove_expression_row(r)
-                        except Exception:
-                            # fallback: attempt to remove row directly and unsubscribe
-                            try:
-                                it = self.expr_table.item(r, 1)
-                                if it:
-                                    name = it.text().replace('▶ ','').replace('▼ ','').strip()
-                                    if name in self.subscriptions:
-                                        try:
-                                            self._send({'id': 'unsub-'+name, 'type': 'unsubscribe', 'path': name})
-                                            try:
-                                                self.subscriptions.remove(name)
-                                            except Exception:
-                                                pass
-                                        except Exception:
-                                            pass
-                                self.expr_table.removeRow(r)
-                            except Exception:
-                                pass
-                    # save config after removals
-                    self._save_config()
-                    return True
-        except Exception:
-            pass
+        if obj is self.expr_table and event.type() == QEvent.KeyPress and event.key() == Qt.Key_Delete:
+            sel = self.expr_table.selectionModel().selectedRows()
+            if not sel:
+                return False
+            m = self._expr_model
+            # map selected rows to top-level expression rows (if user selected a field row)
+            rows = []
+            for s in sel:
+                r0 = s.row()
+                if m.is_field(r0):
+                    prow = self._find_expr_row(m.parents[r0])
+                    if prow is not None:
+                        rows.append(prow)
+                else:
+                    rows.append(r0)
+            # deduplicate and sort descending so row indices remain valid while removing
+            with _bulk_update(self.expr_table):
+                for r in sorted(set(rows), reverse=True):
+                    self._remove_expression_row(r)
+            # save config after removals
+            self._schedule_save()
+            return True
         return super().eventFilter(obj, event)
 
     # --- expressions table helpers (manage rows and values) ---
     def _find_expr_row(self, expr_name):
-        base = self.expr_table
-        for r in range(base.rowCount()):
-            it = base.item(r, 1)
-            if not it:
-                continue
-            if it.text().strip() == expr_name:
-                return r
-        return None
+        return self._expr_model.find_expr(expr_name)
 
     def _ensure_expr_row(self, expr_name):
         r = self._find_expr_row(expr_name)
         if r is not None:
             return r
         # insert before placeholder
-        base = self.expr_table
-        last = max(0, base.rowCount()-1)
-        base.blockSignals(True)
-        base.insertRow(last)
-        # glyph blank
-        base.setItem(last, 0, QTableWidgetItem(''))
-        it = QTableWidgetItem(expr_name)
-        it.setFlags(it.flags() | Qt.ItemIsEditable)
-        it.setData(Qt.UserRole, expr_name)
-        base.setItem(last, 1, it)
-        base.setItem(last, 2, QTableWidgetItem(''))
-        base.setItem(last, 3, QTableWidgetItem(''))
-        base.blockSignals(False)
+        m = self._expr_model
+        last = max(0, m.placeholder_row())
+        m.insert_rows(last, [('', expr_name, '', '', expr_name, None)])
         return last
 
     def _remove_expression_row(self, row):
         """Remove a top-level expression row and any trailing expanded field rows.
         Unsubscribe if necessary, update subscriptions set, and save config.
         """
-        base = self.expr_table
-        if row < 0 or row >= base.rowCount():
+        m = self._expr_model
+        if row < 0 or row >= m.rowCount():
             return
         # ensure this is not a field row
-        it = base.item(row, 1)
-        if it is None:
+        if m.is_field(row):
             return
-        try:
-            meta = it.data(Qt.UserRole)
-            if isinstance(meta, dict) and meta.get('isField'):
-                # nothing to remove here
-                return
-        except Exception:
-            pass
-        name = it.text().replace('▶ ', '').replace('▼ ', '').strip()
+        # the glyph lives in its own column, so the stored key is the bare expression name
+        name = m.keys[row] or m.texts[row].strip()
         # unsubscribe if subscribed
         if name in self.subscriptions:
-            try:
-                self._send({'id': 'unsub-'+name, 'type': 'unsubscribe', 'path': name})
-                try:
-                    self.subscriptions.remove(name)
-                except Exception:
-                    pass
-            except Exception:
-                pass
+            self._send({'type': 'unsubscribe', 'path': name})
+            self._remove_sub(name)
         # clear expanded state and close any open dialogs for this object
-        try:
-            if name in self.expanded_exprs:
-                try:
-                    self.expanded_exprs.remove(name)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        try:
-            if name in self.open_object_dialogs:
-                try:
-                    dlg = self.open_object_dialogs[name]['dialog']
-                    dlg.close()
-                except Exception:
-                    pass
-                try:
-                    del self.open_object_dialogs[name]
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        # remove trailing field rows
-        i = row + 1
-        while i < base.rowCount():
-            it2 = base.item(i, 1)
-            if it2 is None:
-                break
-            try:
-                meta2 = it2.data(Qt.UserRole)
-                if isinstance(meta2, dict) and meta2.get('isField'):
-                    base.removeRow(i)
-                    continue
-            except Exception:
-                pass
-            break
-        # extra safety: sweep table and remove any dangling field rows for this parent
-        try:
-            r2 = 0
-            while r2 < base.rowCount():
-                try:
-                    it3 = base.item(r2, 1)
-                    if it3:
-                        meta3 = it3.data(Qt.UserRole)
-                        if isinstance(meta3, dict) and meta3.get('isField') and meta3.get('parent') == name:
-                            base.removeRow(r2)
-                            continue
-                except Exception:
-                    pass
-                r2 += 1
-        except Exception:
-            pass
-        # remove the parent row itself
-        base.removeRow(row)
-        self._save_config()
+        self.expanded_exprs.discard(name)
+        entry = self.open_object_dialogs.pop(name, None)
+        if entry is not None:
+            entry['dialog'].close()
+        # remove the parent row together with its trailing field rows; field rows always
+        # directly follow their expression, so no further sweep is needed
+        m.remove_rows(row, 1 + m.field_span(row))
+        self._schedule_save()
         self._log('Removed expression and unsubscribed', name)
 
     def _set_expr_value(self, expr_name, value):
         r = self._find_expr_row(expr_name)
         if r is None:
             r = self._ensure_expr_row(expr_name)
-        try:
-            self.expr_table.item(r, 3).setText(str(value))
-        except Exception:
-            self.expr_table.setItem(r, 3, QTableWidgetItem(str(value)))
+        self._expr_model.set_cell(r, 3, str(value))
 
-    def _style_expr_row(self, row):
-        try:
-            item = self.expr_table.item(row, 1)
-            if item:
-                f = item.font()
-                f.setBold(True)
-                item.setFont(f)
-        except Exception:
-            pass
+    def _summary_value(self, expr_name, state):
+        # parent Value text: an expanded object already shows its fields row by row,
+        # so only collapsed objects pay for serializing the whole state
+        if isinstance(state, dict):
+            if expr_name in self.expanded_exprs:
+                n = len(state)
+                return f'{{{n} field}}' if n == 1 else f'{{{n} fields}}'
+            return json.dumps(state)
+        return state
+
+    def _sorted_keys_for(self, name, state):
+        # sorted keys of a dict state, re-sorted only when the object's key set changed
+        cached = self._sorted_keys.get(name)
+        if cached is not None and state.keys() == cached[0]:
+            return cached[1]
+        keys = tuple(sorted(state))
+        self._sorted_keys[name] = (frozenset(keys), keys)
+        return keys
+
+    def _field_keys(self, expr_name, state):
+        # field keys shown inline for a state, in display order (matches _field_rows)
+        if state is None:
+            return ('<no state>',)
+        if isinstance(state, dict):
+            return self._sorted_keys_for(expr_name, state)
+        return ('<value>',)
 
-    def _style_field_row(self, row):
-        try:
-            # indent field name (in Expression column) and apply light background
-            item = self.expr_table.item(row, 1)
-            if item:
-                item.setText('  ' + item.text())
-            # set background color for the row for readability
-            for c in range(4):
-                it = self.expr_table.item(row, c)
-                if it:
-                    it.setBackground(QColor('#2b2b2b'))
-                    it.setForeground(QColor('#e6e6e6'))
-        except Exception:
-            pass
+    def _field_rows(self, expr_name, state):
+        # build inline field rows (glyph, text, type, value, key, parent) for an expression
+        if state is None:
+            # placeholder row indicating no state yet
+            return [('', '<no state>', '', '', '<no state>', expr_name)]
+        if isinstance(state, dict):
+            return [('', str(k), '', _fmt_value(state[k]), k, expr_name) for k in self._sorted_keys_for(expr_name, state)]
+        return [('', '<value>', '', _fmt_value(state), '<value>', expr_name)]
 
     def _refresh_expanded_expr(self, expr_name):
         # update field rows for an expanded expression from cache
@@ -389,60 +800,10 @@ class LiveWatchGUI(QWidget):
         r = self._find_expr_row(expr_name)
         if r is None:
             return
-        state = self.cache.get('states', {}).get(expr_name)
-        base = self.expr_table
-        base.blockSignals(True)
-        # remove existing field rows first (they are marked by isField)
-        i = r + 1
-        while i < base.rowCount():
-            it = base.item(i, 1)
-            if it is None:
-                break
-            meta = it.data(Qt.UserRole)
-            if isinstance(meta, dict) and meta.get('isField'):
-                base.removeRow(i)
-                continue
-            break
-
-        # re-insert rows from state
-        insert_at = r + 1
-        if state is None:
-            # show placeholder row indicating no state yet
-            base.insertRow(insert_at)
-            base.setItem(insert_at, 0, QTableWidgetItem(''))
-            fk = QTableWidgetItem('<no state>')
-            fk.setData(Qt.UserRole, {'isField': True, 'parent': expr_name, 'field': '<no state>'})
-            base.setItem(insert_at, 1, fk)
-            base.setItem(insert_at, 2, QTableWidgetItem(''))
-            base.setItem(insert_at, 3, QTableWidgetItem(''))
-            self._style_field_row(insert_at)
-        elif isinstance(state, dict):
-            for k in sorted(state.keys()):
-                v = state[k]
-                base.insertRow(insert_at)
-                # glyph blank for field row
-                base.setItem(insert_at, 0, QTableWidgetItem(''))
-                fk = QTableWidgetItem(str(k))
-                fk.setData(Qt.UserRole, {'isField': True, 'parent': expr_name, 'field': k})
-                base.setItem(insert_at, 1, fk)
-                base.setItem(insert_at, 2, QTableWidgetItem(''))
-                val_it = QTableWidgetItem(str(v))
-                val_it.setFlags(val_it.flags() | Qt.ItemIsEditable)
-                base.setItem(insert_at, 3, val_it)
-                self._style_field_row(insert_at)
-                insert_at += 1
-        else:
-            base.insertRow(insert_at)
-            base.setItem(insert_at, 0, QTableWidgetItem(''))
-            fk = QTableWidgetItem('<value>')
-            fk.setData(Qt.UserRole, {'isField': True, 'parent': expr_name, 'field': '<value>'})
-            base.setItem(insert_at, 1, fk)
-            base.setItem(insert_at, 2, QTableWidgetItem(''))
-            val_it = QTableWidgetItem(str(state))
-            val_it.setFlags(val_it.flags() | Qt.ItemIsEditable)
-            base.setItem(insert_at, 3, val_it)
-            self._style_field_row(insert_at)
-        base.blockSignals(False)
+        state = self.cache['states'].get(expr_name)
+        m = self._expr_model
+        # overwrite existing field rows and resize the block once by the difference
+        m.replace_rows(r + 1, m.field_span(r), self._field_rows(expr_name, state))
 
     def _update_expanded_fields_from_state(self, expr_name):
         """Update Value column (col 3) of already-expanded field rows in-place from cached state.
@@ -454,110 +815,146 @@ class LiveWatchGUI(QWidget):
         r = self._find_expr_row(expr_name)
         if r is None:
             return
-        state = self.cache.get('states', {}).get(expr_name)
-        base = self.expr_table
-        base.blockSignals(True)
-        i = r + 1
-        found_field = False
-        while i < base.rowCount():
-            it = base.item(i, 1)
-            if it is None:
-                break
-            try:
-                meta = it.data(Qt.UserRole)
-            except Exception:
-                meta = None
-            if isinstance(meta, dict) and meta.get('isField'):
-                found_field = True
-                field_name = meta.get('field')
-                # derive new value from state
-                if isinstance(state, dict):
-                    newv = state.get(field_name, '')
-                else:
-                    # for scalar parent, only '<value>' field should update
-                    if field_name == '<value>':
-                        newv = state
-                    else:
-                        newv = ''
-                try:
-                    base.item(i, 3).setText(str(newv))
-                except Exception:
-                    base.setItem(i, 3, QTableWidgetItem(str(newv)))
-                i += 1
-                continue
-            break
-        base.blockSignals(False)
-        if not found_field:
+        state = self.cache['states'].get(expr_name)
+        m = self._expr_model
+        span = m.field_span(r)
+        if not span:
             # no inline field rows present — insert them
-            QTimer.singleShot(0, lambda n=expr_name: self._refresh_expanded_expr(n))
+            self._refresh_expanded_expr(expr_name)
+            return
+        texts = []
+        for field_name in m.keys[r + 1:r + 1 + span]:
+            # derive new value from state
+            if isinstance(state, dict):
+                newv = state.get(field_name, '')
+            else:
+                # for scalar parent, only '<value>' field should update
+                if field_name == '<value>':
+                    newv = state
+                else:
+                    newv = ''
+            texts.append(_fmt_value(newv))
+        m.set_column_span(r + 1, 3, texts)
 
     def _set_expr_type(self, expr_name, typ):
         r = self._find_expr_row(expr_name)
         if r is None:
             r = self._ensure_expr_row(expr_name)
-        try:
-            # Type column is column 2
-            self.expr_table.item(r, 2).setText(str(typ))
-        except Exception:
-            self.expr_table.setItem(r, 2, QTableWidgetItem(str(typ)))
+        # Type column is column 2
+        self._expr_model.set_cell(r, 2, str(typ))
 
     def _set_expr_type_if_exists(self, expr_name, typ):
         """Set the Type column only if the expression row already exists. Do not create a new row."""
         r = self._find_expr_row(expr_name)
         if r is None:
             return
-        try:
-            self.expr_table.item(r, 2).setText(str(typ))
-        except Exception:
-            self.expr_table.setItem(r, 2, QTableWidgetItem(str(typ)))
+        self._expr_model.set_cell(r, 2, str(typ))
+
+    def _record_history(self, name, payload):
+        # store history for changed fields when payload is dict
+        if isinstance(payload, dict):
+            hist = self.cache.setdefault('history', {})
+            h = hist.setdefault(name, {})
+            for k, v in payload.items():
+                lst = h.get(k)
+                if lst is None:
+                    lst = h[k] = deque(maxlen=HISTORY_CAP)
+                lst.append((time.time(), v))
+
+    def _coalesce_update(self, pending, name, payload, replace=False):
+        """Fold one state/update payload into `pending` (name -> [replace, payload]).
+        Folding follows the same rules as _merge_update_and_refresh so a single merge per
+        object at the end of a tick leaves the cache identical to merging every message.
+        History is recorded per message so no intermediate values are lost.
+        If pending is None the payload is merged immediately.
+        """
+        self._record_history(name, payload)
+        if pending is None:
+            self._merge_update_and_refresh(name, payload, replace=replace, record=False)
+            return
+        entry = pending.get(name)
+        if replace or not isinstance(payload, dict):
+            pending[name] = [replace, payload]
+        elif entry is None:
+            pending[name] = [False, dict(payload)]
+        elif isinstance(entry[1], dict):
+            entry[1].update(payload)
+        else:
+            # dict changes on top of a scalar start a fresh dict
+            pending[name] = [True, dict(payload)]
+
+    def _remember_parsed_line(self, line, msg):
+        # track the last line per object; its parse is only kept (as a private copy, the cache
+        # may adopt and later mutate msg's payload) once the line has repeated, so a stream of
+        # changing values never pays for the copy
+        if line is None:
+            return
+        name = msg.get('path')
+        prev = self._last_line.get(name)
+        if prev == line:
+            entry = self._repeat_lines[line]
+            if entry[1] is None:
+                entry[1] = _copy_message(msg)
+            return
+        if prev is not None:
+            del self._repeat_lines[prev]
+        self._last_line[name] = line
+        self._repeat_lines[line] = [name, None]
 
-    def _merge_update_and_refresh(self, name, payload, replace=False):
+    def _merge_update_and_refresh(self, name, payload, replace=False, record=True):
         """Merge payload into cached state for `name`.
         If replace=True, replace the cached object with payload (used for full 'state').
         If replace=False, update existing dict with payload fields.
+        If record=False, the caller has already stored history for this payload.
         After merge, update the parent Value column, notify dialogs, update inline fields.
         """
-        try:
-            if replace:
-                self.cache['states'][name] = payload
-            else:
-                cur = self.cache['states'].get(name, {})
-                # ensure cur is a dict before update
-                if not isinstance(cur, dict):
-                    cur = {}
-                if isinstance(payload, dict):
-                    cur.update(payload)
-                else:
-                    # scalar replace
-                    cur = payload
-                self.cache['states'][name] = cur
-            # store history for changed fields when payload is dict
+        states = self.cache['states']
+        if replace:
+            states[name] = payload
+        else:
+            cur = states.get(name)
+            # ensure cur is a dict before update
+            if not isinstance(cur, dict):
+                cur = {}
             if isinstance(payload, dict):
-                hist = self.cache.setdefault('history', {})
-                h = hist.setdefault(name, {})
-                for k, v in payload.items():
-                    lst = h.setdefault(k, [])
-                    lst.append((time.time(), v))
-            # set parent Value column from merged cache
-            st = self.cache['states'].get(name)
-            try:
-                if isinstance(st, dict):
-                    self._set_expr_value(name, json.dumps(st))
-                else:
-                    self._set_expr_value(name, st)
-            except Exception:
-                pass
-            # notify any open dialogs
-            try:
-                self._notify_dialog(name, self.cache['states'].get(name))
-            except Exception:
-                pass
-            # refresh expanded inline field rows (fast path updates)
-            QTimer.singleShot(0, lambda n=name: self._update_expanded_fields_from_state(n))
-            # ensure full rows exist shortly after
-            QTimer.singleShot(10, lambda n=name: self._refresh_expanded_expr(n))
-        except Exception:
-            pass
+                cur.update(payload)
+            else:
+                # scalar replace
+                cur = payload
+            states[name] = cur
+        if record:
+            self._record_history(name, payload)
+        # set parent Value column from merged cache
+        st = states[name]
+        self._set_expr_value(name, self._summary_value(name, st))
+        # notify any open dialogs; a partial update only repaints the keys it carried
+        self._notify_dialog(name, st, None if replace or not isinstance(payload, dict) else payload)
+        # refresh expanded inline field rows on the next coalesced flush
+        if name in self.expanded_exprs:
+            self._dirty_expanded.add(name)
+            if not self._refresh_scheduled:
+                self._refresh_scheduled = True
+                QTimer.singleShot(16, self._flush_expanded)
+
+    def _flush_expanded(self):
+        # apply inline field refreshes collected since the last flush (caps redraws at ~60 Hz);
+        # rows are only rebuilt when the object's field set changed, otherwise values update in place
+        self._refresh_scheduled = False
+        names = self._dirty_expanded
+        self._dirty_expanded = set()
+        m = self._expr_model
+        for name in names:
+            if name not in self.expanded_exprs:
+                continue
+            r = self._find_expr_row(name)
+            if r is None:
+                continue
+            state = self.cache['states'].get(name)
+            span = m.field_span(r)
+            if span and tuple(m.keys[r + 1:r + 1 + span]) == self._field_keys(name, state):
+                self._update_expanded_fields_from_state(name)
+            else:
+                self._refresh_expanded_expr(name)
 
     def _expand_expr(self, expr_name):
         # Insert rows below the expression showing fields from cached state
@@ -566,97 +963,31 @@ class LiveWatchGUI(QWidget):
             r = self._ensure_expr_row(expr_name)
         if expr_name in self.expanded_exprs:
             return
-        state = self.cache.get('states', {}).get(expr_name)
-        base = self.expr_table
-        base.blockSignals(True)
-        insert_at = r + 1
-        if isinstance(state, dict):
-            for k in sorted(state.keys()):
-                v = state[k]
-                base.insertRow(insert_at)
-                fk = QTableWidgetItem(str(k))
-                # mark as field metadata
-                fk.setData(Qt.UserRole, {'isField': True, 'parent': expr_name, 'field': k})
-                # glyph blank for field row
-                base.setItem(insert_at, 0, QTableWidgetItem(''))
-                # put field name in Expression column
-                base.setItem(insert_at, 1, fk)
-                base.setItem(insert_at, 2, QTableWidgetItem(''))
-                val_it = QTableWidgetItem(str(v))
-                val_it.setFlags(val_it.flags() | Qt.ItemIsEditable)
-                base.setItem(insert_at, 3, val_it)
-                self._style_field_row(insert_at)
-                insert_at += 1
-        else:
-            # scalar - show a single '<value>' row
-            base.insertRow(insert_at)
-            base.setItem(insert_at, 0, QTableWidgetItem(''))
-            fk = QTableWidgetItem('<value>')
-            fk.setData(Qt.UserRole, {'isField': True, 'parent': expr_name, 'field': '<value>'})
-            base.setItem(insert_at, 1, fk)
-            base.setItem(insert_at, 2, QTableWidgetItem(''))
-            val_it = QTableWidgetItem(str(state))
-            val_it.setFlags(val_it.flags() | Qt.ItemIsEditable)
-            base.setItem(insert_at, 3, val_it)
-            self._style_field_row(insert_at)
+        state = self.cache['states'].get(expr_name)
+        m = self._expr_model
+        m.insert_rows(r + 1, self._field_rows(expr_name, state))
         # set parent glyph to expanded
-        try:
-            gi = base.item(r, 0)
-            if gi is None:
-                gi = QTableWidgetItem('▼')
-                gi.setFlags(Qt.ItemIsEnabled)
-                base.setItem(r, 0, gi)
-            else:
-                gi.setText('▼')
-        except Exception:
-            pass
-        # ensure parent glyph shows expanded state
-        try:
-            gi = base.item(r, 0)
-            if gi is None:
-                gi = QTableWidgetItem('▼')
-                gi.setFlags(Qt.ItemIsEnabled)
-                base.setItem(r, 0, gi)
-            else:
-                gi.setText('▼')
-        except Exception:
-            pass
-        base.blockSignals(False)
+        m.set_cell(r, 0, '▼')
         self.expanded_exprs.add(expr_name)
+        if state is not None:
+            m.set_cell(r, 3, str(self._summary_value(expr_name, state)))
 
     def _collapse_expr(self, expr_name):
         r = self._find_expr_row(expr_name)
         if r is None:
             return
-        base = self.expr_table
-        base.blockSignals(True)
-        # remove rows immediately following r that are field rows (we marked them with UserRole isField)
-        i = r + 1
-        while i < base.rowCount():
-            it = base.item(i, 1)
-            if it is None:
-                break
-            meta = it.data(Qt.UserRole)
-            if isinstance(meta, dict) and meta.get('isField'):
-                base.removeRow(i)
-                continue
-            break
-        base.blockSignals(False)
+        m = self._expr_model
+        # remove rows immediately following r that are field rows
+        m.remove_rows(r + 1, m.field_span(r))
         try:
             self.expanded_exprs.remove(expr_name)
         except Exception:
             pass
-        # reset parent glyph to collapsed
-        try:
-            gi = base.item(r, 0)
-            if gi is None:
-                gi = QTableWidgetItem('▶')
-                gi.setFlags(Qt.ItemIsEnabled)
-                base.setItem(r, 0, gi)
-            else:
-                gi.setText('▶')
-        except Exception:
-            pass
+        # reset parent glyph to collapsed and show the full state summary again
+        m.set_cell(r, 0, '▶')
+        state = self.cache['states'].get(expr_name)
+        if state is not None:
+            m.set_cell(r, 3, str(self._summary_value(expr_name, state)))
 
 
     def apply_filter(self):
@@ -688,11 +1019,12 @@ class LiveWatchGUI(QWidget):
     def _load_config(self):
         if CONFIG_PATH.exists():
             try:
-                cfg = json.loads(CONFIG_PATH.read_text())
+                cfg = _loads(CONFIG_PATH.read_bytes())
                 port = cfg.get('port')
                 baud = str(cfg.get('baud', '115200'))
                 subs = cfg.get('subscriptions', [])
                 self.subscriptions = set(subs)
+                self._subs_snapshot = None
                 self.require_subscription = cfg.get('require_subscription', True)
                 # do not load expressions from config anymore (we only persist subscriptions)
                 if port:
@@ -711,153 +1043,105 @@ class LiveWatchGUI(QWidget):
                'subscriptions': list(self.subscriptions), 'require_subscription': self.require_sub_chk.isChecked()}
         # save expressions
         try:
+            m = self._expr_model
             exprs = []
-            for r in range(self.expr_table.rowCount()):
+            for r in range(m.rowCount()):
                 # columns: 0=glyph,1=expr,2=type,3=value
-                item = self.expr_table.item(r, 1)
-                if item is None:
-                    continue
-                # skip inline field rows (they store dict in UserRole) and placeholder rows
-                try:
-                    meta = item.data(Qt.UserRole)
-                except Exception:
-                    meta = None
-                if isinstance(meta, dict) and meta.get('isField'):
+                # skip inline field rows and placeholder rows
+                if m.is_field(r):
                     continue
-                # skip placeholder 'Add expression' rows
-                text = item.text().strip()
+                text = m.texts[r].strip()
                 if not text:
                     continue
+                # skip placeholder 'Add expression' rows
                 if text.lower().startswith('add expression'):
                     continue
-                it_type = self.expr_table.item(r, 2)
-                it_val = self.expr_table.item(r, 3)
-                exprs.append({'expr': text, 'type': it_type.text() if it_type else '', 'value': it_val.text() if it_val else ''})
+                value = m.values[r]
+                state = self.cache['states'].get(m.keys[r])
+                if m.keys[r] in self.expanded_exprs and isinstance(state, dict):
+                    # an expanded row shows a '{N fields}' marker; save the object itself
+                    value = json.dumps(state)
+                exprs.append({'expr': text, 'type': m.types[r], 'value': value})
             cfg['expressions'] = exprs
         except Exception:
             cfg['expressions'] = []
         try:
-            CONFIG_PATH.write_text(json.dumps(cfg, indent=2))
+            CONFIG_PATH.write_bytes(_dumps_config(cfg))
             self._log('Saved config')
         except Exception as e:
             self._log('Failed save config:', e)
 
+    def _schedule_save(self):
+        # debounce config writes: a burst of edits/removals results in a single write
+        if not self._save_pending:
+            self._save_pending = True
+            QTimer.singleShot(500, self._do_save_if_pending)
+
+    def _do_save_if_pending(self):
+        if self._save_pending:
+            self._save_pending = False
+            self._save_config()
+
+    def closeEvent(self, event):
+        # write any debounced config change before the window goes away
+        self._do_save_if_pending()
+        super().closeEvent(event)
+
     # Expressions table helpers
     def _add_expr_placeholder(self):
         # one placeholder row with disabled look
-        try:
-            base = self.expr_table
-        except Exception:
-            return
+        m = self._expr_model
+        ph = self._ph_text
         # ensure there's exactly one placeholder as the last row
-        base.blockSignals(True)
-        if base.rowCount() == 0:
-            base.setRowCount(1)
-        # always ensure last row exists and shows placeholder text
-        last = base.rowCount() - 1
-        # choose placeholder text based on history
-        ph = 'Add expression'
-        try:
-            if getattr(self, 'past_expr_count', 0):
-                ph = f'Add expression ({self.past_expr_count} prev)'
-        except Exception:
-            ph = 'Add expression'
-        # glyph blank, expression in col 1
-        it = QTableWidgetItem(ph)
-        it.setFlags(Qt.ItemIsEnabled | Qt.ItemIsEditable)
-        it.setData(Qt.UserRole, '')
-        base.setItem(last, 1, it)
-        base.setItem(last, 0, QTableWidgetItem(''))
-        base.setItem(last, 2, QTableWidgetItem(''))
-        base.setItem(last, 3, QTableWidgetItem(''))
-        base.blockSignals(False)
+        last = m.placeholder_row()
+        if last < 0:
+            m.insert_rows(0, [('', ph, '', '', '', None)])
+            return
+        # always ensure last row shows placeholder text
+        for c, text in enumerate(('', ph, '', '')):
+            m.set_cell(last, c, text)
+        m.set_key(last, '')
 
     def _update_expr_placeholder_text(self):
-        try:
-            base = self.expr_table
-        except Exception:
+        m = self._expr_model
+        last = m.placeholder_row()
+        if last < 0:
+            self._add_expr_placeholder()
             return
-        base.blockSignals(True)
-        if base.rowCount() == 0:
-            base.setRowCount(1)
-        last = base.rowCount() - 1
-        ph = 'Add expression'
-        try:
-            if getattr(self, 'past_expr_count', 0):
-                ph = f'Add expression ({self.past_expr_count} prev)'
-        except Exception:
-            ph = 'Add expression'
-        it = base.item(last, 1)
-        if it is None:
-            it = QTableWidgetItem(ph)
-            it.setFlags(Qt.ItemIsEnabled | Qt.ItemIsEditable)
-            it.setData(Qt.UserRole, '')
-            base.setItem(last, 1, it)
-            base.setItem(last, 0, QTableWidgetItem(''))
-            base.setItem(last, 2, QTableWidgetItem(''))
-            base.setItem(last, 3, QTableWidgetItem(''))
-        else:
-            it.setText(ph)
-            it.setData(Qt.UserRole, '')
-        base.blockSignals(False)
+        m.set_cell(last, 1, self._ph_text)
+        m.set_key(last, '')
 
     def _add_expression_row(self, expr, typ, val):
-        try:
-            base = self.expr_table
-        except Exception:
-            return
-        base.blockSignals(True)
+        m = self._expr_model
         # ensure placeholder exists
-        if base.rowCount() == 0:
-            base.setRowCount(1)
-        last = base.rowCount() - 1
-        row = max(0, last)
+        last = m.placeholder_row()
+        if last < 0:
+            self._add_expr_placeholder()
+            last = 0
         # insert before the placeholder (which is last)
-        base.insertRow(last)
-        # glyph col
-        g = QTableWidgetItem('▶')
-        g.setFlags(Qt.ItemIsEnabled)
-        base.setItem(last, 0, g)
-        it = QTableWidgetItem(expr)
-        it.setFlags(it.flags() | Qt.ItemIsEditable)
-        it.setData(Qt.UserRole, expr)
-        base.setItem(last, 1, it)
-        # type non-editable
-        t = QTableWidgetItem(typ)
-        t.setFlags(Qt.ItemIsEnabled)
-        base.setItem(last, 2, t)
-        base.setItem(last, 3, QTableWidgetItem(val))
-        base.blockSignals(False)
+        m.insert_rows(last, [m.expr_row(expr, typ, val)])
 
     def on_expr_double_clicked(self, row, col):
-        try:
-            base = self.expr_table
-        except Exception:
-            return
+        base = self.expr_table
         # If placeholder clicked, start editing placeholder to add new expression
-        last = base.rowCount()-1
-        if row == last:
+        if row == self._expr_model.placeholder_row():
             # edit the placeholder expression (Expression column)
-            self.expr_table.editItem(base.item(row, 1))
+            base.edit(self._expr_model.index(row, 1))
             return
 
     def on_expr_cell_clicked(self, row, col):
         """Handle single clicks on the expressions table.
         Clicking the glyph column (0) toggles expand/collapse. Clicking other columns is handled elsewhere.
         """
-        try:
-            base = self.expr_table
-        except Exception:
-            return
+        m = self._expr_model
         # ignore clicks on placeholder row
-        last = base.rowCount() - 1
-        if row == last:
+        if row == m.placeholder_row():
             return
         if col == 0:
-            it = base.item(row, 1)
-            if not it:
+            # field rows have nothing to expand
+            if m.is_field(row):
                 return
-            name = it.text().strip()
+            name = m.keys[row] or m.texts[row].strip()
             if not name:
                 return
             if name in self.expanded_exprs:
@@ -866,137 +1150,97 @@ class LiveWatchGUI(QWidget):
                 self._expand_expr(name)
 
     def on_expr_context_menu(self, pos):
-        try:
-            base = self.expr_table
-        except Exception:
-            return
+        base = self.expr_table
         idx = base.indexAt(pos)
         if not idx.isValid():
             return
         r = idx.row()
-        if r == base.rowCount()-1:
+        if r == self._expr_model.placeholder_row():
             return
         from PySide6.QtWidgets import QMenu
+        model = self._expr_model
+        # a field row opens its parent expression
+        name = model.parents[r] if model.is_field(r) else model.keys[r]
         m = QMenu(self)
+        act_open = m.addAction('Open in window')
         act_del = m.addAction('Remove expression (and unsubscribe)')
         action = m.exec(base.viewport().mapToGlobal(pos))
-        if action == act_del:
+        if action == act_open:
+            self._open_object_dialog(name)
+        elif action == act_del:
             # remove using helper so trailing field rows are removed too
-            try:
-                self._remove_expression_row(r)
-            except Exception:
-                pass
+            self._remove_expression_row(r)
     def on_expr_cell_changed(self, row, col):
-        base = self.expr_table
+        # called for edits made through the view (ExprTableModel.cellEdited)
+        m = self._expr_model
         # protect if table is empty
-        if base.rowCount() == 0:
+        last = m.placeholder_row()
+        if last < 0:
             return
-        last = base.rowCount() - 1
-        item = base.item(row, 1)  # get expression cell (Expression column)
-        if item is None: return
-        new = item.text().strip()
+        new = m.texts[row].strip()
 
-        # Check if this is a field row (we store dict in UserRole for field rows)
-        fld_meta = None
-        try:
-            meta = base.item(row, 1).data(Qt.UserRole)
-            if isinstance(meta, dict) and meta.get('isField'):
-                fld_meta = meta
-        except Exception:
-            fld_meta = None
-        if fld_meta is not None:
+        # Check if this is a field row
+        if m.is_field(row):
             # only value column edits (col 3) are meaningful for field rows
             if col != 3:
                 return
-            parent = fld_meta.get('parent')
-            field = fld_meta.get('field')
-            new_val_str = base.item(row, 3).text() if base.item(row, 3) else ''
-            new_val = self._coerce_value(new_val_str)
-            msg = {'id': f'set-{parent}-{field}', 'type': 'set', 'path': parent, 'changes': {field: new_val}}
-            self._send(msg)
+            parent = m.parents[row]
+            field = m.keys[row]
+            new_val = self._coerce_value(m.values[row])
+            msg = {'type': 'set', 'path': parent, 'changes': {field: new_val}}
+            self._send(msg, flush=True)
             self._log('Sent set for', parent, field, '->', new_val)
             return
 
         # If editing placeholder (last row) and Expression column
         if row == last and col == 1:
-            # if user left it empty, keep placeholder visual
-            if not new:
-                base.blockSignals(True)
-                item.setText('Add expression')
-                item.setData(Qt.UserRole, '')
-                base.blockSignals(False)
+            # if user left it empty or committed the placeholder label itself, keep placeholder visual
+            if not new or new == self._ph_text:
+                m.set_cell(row, 1, self._ph_text)
+                m.set_key(row, '')
                 return
             # user entered a new expression: insert as a real row before placeholder
-            base.blockSignals(True)
-            base.insertRow(last)
-            # glyph
-            g = QTableWidgetItem('▶')
-            g.setFlags(Qt.ItemIsEnabled)
-            base.setItem(last, 0, g)
-            it = QTableWidgetItem(new)
-            it.setFlags(it.flags() | Qt.ItemIsEditable)
-            it.setData(Qt.UserRole, new)
-            base.setItem(last, 1, it)
-            base.setItem(last, 2, QTableWidgetItem('object'))
-            base.setItem(last, 3, QTableWidgetItem(''))
+            m.insert_rows(last, [m.expr_row(new)])
             # restore placeholder text in the placeholder row
-            placeholder = base.item(last+1, 1)
-            if placeholder:
-                placeholder.setText('Add expression')
-                placeholder.setData(Qt.UserRole, '')
-            base.blockSignals(False)
+            m.set_cell(last+1, 1, self._ph_text)
+            m.set_key(last+1, '')
             # subscribe to new expression
             try:
-                self._send({'id': 'sub-'+new, 'type': 'subscribe', 'path': new})
-                self.subscriptions.add(new)
+                self._send({'type': 'subscribe', 'path': new})
+                self._add_sub(new)
             except Exception as e:
                 self._log('Failed subscribe for new expression', new, e)
-            self._save_config()
+            self._schedule_save()
             self._log('Added expression and subscribed to', new)
             return
 
         # Editing an existing expression row (rename)
-        old = ''
-        try:
-            old_item = base.item(row, 1)
-            if old_item:
-                old = old_item.data(Qt.UserRole) or ''
-        except Exception:
-            old = ''
+        old = m.keys[row] or ''
         # if new name empty -> remove row and unsubscribe
         if not new:
             if old in self.subscriptions:
-                self._send({'id': 'unsub-'+old, 'type': 'unsubscribe', 'path': old})
-                try:
-                    self.subscriptions.remove(old)
-                except Exception:
-                    pass
-            base.blockSignals(True)
-            base.removeRow(row)
-            base.blockSignals(False)
-            self._save_config()
+                self._send({'type': 'unsubscribe', 'path': old})
+                self._remove_sub(old)
+            # drop any inline field rows along with the expression
+            m.remove_rows(row, 1 + m.field_span(row))
+            self.expanded_exprs.discard(old)
+            self._schedule_save()
             self._log('Removed expression via empty edit and unsubscribed', old)
             return
         # if name changed, perform rename: unsubscribe old (if subscribed), subscribe new
         if new != old:
             if old in self.subscriptions:
-                self._send({'id': 'unsub-'+old, 'type': 'unsubscribe', 'path': old})
-                try:
-                    self.subscriptions.remove(old)
-                except Exception:
-                    pass
+                self._send({'type': 'unsubscribe', 'path': old})
+                self._remove_sub(old)
                 # subscribe new
                 try:
-                    self._send({'id': 'sub-'+new, 'type': 'subscribe', 'path': new})
-                    self.subscriptions.add(new)
+                    self._send({'type': 'subscribe', 'path': new})
+                    self._add_sub(new)
                 except Exception as e:
                     self._log('Failed subscribe during rename', new, e)
             # update stored name metadata
-            try:
-                base.item(row, 1).setData(Qt.UserRole, new)
-            except Exception:
-                pass
-            self._save_config()
+            m.set_key(row, new)
+            self._schedule_save()
             self._log('Renamed expression', old, '->', new)
 
     def _open_object_dialog(self, name):
@@ -1015,8 +1259,9 @@ class LiveWatchGUI(QWidget):
         d = QDialog(self)
         d.setWindowTitle(f'Object: {name}')
         ly = QVBoxLayout(d)
-        table = QTableWidget(0, 2)
-        table.setHorizontalHeaderLabels(['Field', 'Value'])
+        model = DictModel(d)
+        table = QTableView()
+        table.setModel(model)
         table.verticalHeader().setVisible(False)
         table.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked)
         ly.addWidget(table)
@@ -1044,7 +1289,7 @@ class LiveWatchGUI(QWidget):
 
         def refresh():
             # request state from device
-            self._send({'id': f'get-{name}', 'type': 'get', 'path': name})
+            self._send({'type': 'get', 'path': name})
         btn_refresh.clicked.connect(refresh)
 
         # context menu to delete a field
@@ -1053,84 +1298,57 @@ class LiveWatchGUI(QWidget):
             if not idx.isValid():
                 return
             r = idx.row()
-            field_item = table.item(r, 0)
-            if not field_item:
-                return
-            field = field_item.text()
+            field = str(model.key(r))
             from PySide6.QtWidgets import QMenu
             m = QMenu(d)
             act_del = m.addAction('Delete field')
             act = m.exec(table.viewport().mapToGlobal(pos))
             if act == act_del:
                 # send delete
-                self._send({'id': f'del-{name}-{field}', 'type': 'delete', 'path': name, 'field': field})
+                self._send({'type': 'delete', 'path': name, 'field': field})
                 # remove from table
-                table.removeRow(r)
+                model.remove_row(r)
 
         table.setContextMenuPolicy(Qt.CustomContextMenu)
         table.customContextMenuRequested.connect(on_table_context)
 
-        # handle edits in the dialog
-        def on_table_item_changed(item):
-            # only value column edits (col 1)
-            if item.column() != 1:
-                return
-            r = item.row()
-            fld = table.item(r, 0).text() if table.item(r, 0) else None
+        # handle edits in the dialog (value column only, see DictModel.setData)
+        def on_value_edited(fld, new_val):
             if not fld:
                 return
-            new_val = item.text()
             newv = self._coerce_value(new_val)
             # send set for the field
-            msg = {'id': f'set-{name}-{fld}', 'type': 'set', 'path': name, 'changes': {fld: newv}}
-            self._send(msg)
+            msg = {'type': 'set', 'path': name, 'changes': {fld: newv}}
+            self._send(msg, flush=True)
             self._log('Dialog sent set for', name, fld, '->', newv)
 
-        table.itemChanged.connect(on_table_item_changed)
+        model.valueEdited.connect(on_value_edited)
 
-        # function to populate/refresh dialog from state dict
-        def update_state(state):
-            try:
-                table.blockSignals(True)
-                table.setRowCount(0)
-                if not isinstance(state, dict):
-                    # show as single value
-                    table.insertRow(0)
-                    table.setItem(0, 0, QTableWidgetItem('<value>'))
-                    table.setItem(0, 1, QTableWidgetItem(str(state)))
-                else:
-                    keys = sorted(state.keys())
-                    for i, k in enumerate(keys):
-                        v = state[k]
-                        table.insertRow(i)
-                        table.setItem(i, 0, QTableWidgetItem(str(k)))
-                        table.setItem(i, 1, QTableWidgetItem(str(v)))
-            finally:
-                table.blockSignals(False)
+        # function to populate/refresh dialog from state dict; the view only paints visible rows
+        def update_state(state, changed=None):
+            if isinstance(state, dict):
+                model.set_state(state, self._sorted_keys_for(name, state), changed)
+            else:
+                # show as single value
+                model.set_state(state, ('<value>',))
 
         # store dialog and show
         self.open_object_dialogs[name] = {'dialog': d, 'table': table, 'update': update_state}
         # if we have cached state, populate immediately
-        if name in self.cache.get('states', {}):
+        if name in self.cache['states']:
             st = self.cache['states'][name]
             QTimer.singleShot(0, lambda s=st: update_state(s))
         else:
             # request state
-            self._send({'id': f'get-{name}', 'type': 'get', 'path': name})
+            self._send({'type': 'get', 'path': name})
         d.resize(400, 300)
         d.show()
 
-    def _notify_dialog(self, name, state):
-        # called when a new state/update arrives
-        try:
-            entry = self.open_object_dialogs.get(name)
-            if not entry:
-                return
-            update_fn = entry.get('update')
-            if update_fn:
-                update_fn(state)
-        except Exception:
-            pass
+    def _notify_dialog(self, name, state, changed=None):
+        # called when a new state/update arrives; `changed` lists the updated keys if known
+        entry = self.open_object_dialogs.get(name)
+        if entry is not None:
+            entry['update'](state, changed)
 
     def toggle_connect(self):
         if self.ser and self.ser.is_open:
@@ -1145,63 +1363,50 @@ class LiveWatchGUI(QWidget):
             QMessageBox.warning(self, 'No port', 'Please select a serial port')
             return
         try:
-            self.ser = serial.Serial(port, baud, timeout=0.1)
+            # the read timeout bounds how long the reader thread takes to notice a disconnect
+            self.ser = serial.Serial(port, baud, timeout=0.05)
         except Exception as e:
             QMessageBox.critical(self, 'Open failed', str(e))
             return
-        self.reader_running = True
-        self.reader_thread = threading.Thread(target=self._reader, daemon=True)
-        self.reader_thread.start()
+        self._start_reader()
         self.connect_btn.setText('Disconnect')
-        self._save_config()
+        self._schedule_save()
         self._log('Connected', port, baud)
-        # send any queued startup requests (discover/get) staggered to avoid bursts
-        try:
-            if self._pending_startup_requests:
-                delay = 50
-                for req_type, name in list(self._pending_startup_requests):
-                    if req_type == 'discover':
-                        QTimer.singleShot(delay, lambda n=name: self._send({'id': 'discover-'+n, 'type': 'discover', 'path': n}))
-                    elif req_type == 'get':
-                        QTimer.singleShot(delay, lambda n=name: self._send({'id': 'get-'+n, 'type': 'get', 'path': n}))
-                    delay += 50
-                self._pending_startup_requests.clear()
-        except Exception:
-            pass
-
-        # also, send subscribe/discover/get for any configured subscriptions
-        try:
-            if self.subscriptions:
-                delay = 50
-                for name in list(self.subscriptions):
-                    # send subscribe, then discover and get to populate schema/state
-                    QTimer.singleShot(delay, lambda n=name: self._send({'id': 'sub-'+n, 'type': 'subscribe', 'path': n}))
-                    QTimer.singleShot(delay + 30, lambda n=name: self._send({'id': 'discover-'+n, 'type': 'discover', 'path': n}))
-                    QTimer.singleShot(delay + 80, lambda n=name: self._send({'id': 'get-'+n, 'type': 'get', 'path': n}))
-                    delay += 80
-        except Exception:
-            pass
-
-        # also request schema/state for built-in objects so they appear in the device tree
-        try:
-            builtins = ['laser', 'plasma']
-            delay = 30
-            for name in builtins:
-                # only request if we don't already know the schema
-                if name in self.cache.get('schemas', {}):
-                    continue
-                QTimer.singleShot(delay, lambda n=name: self._send({'id': 'discover-'+n, 'type': 'discover', 'path': n}))
-                QTimer.singleShot(delay + 40, lambda n=name: self._send({'id': 'get-'+n, 'type': 'get', 'path': n}))
-                delay += 60
-        except Exception:
-            pass
-        except Exception:
-            pass
+        # queued startup requests, configured subscriptions and built-in objects go out
+        # shortly after the port opens, in small paced writes
+        QTimer.singleShot(50, self._flush_startup)
+
+    def _flush_startup(self):
+        msgs = []
+        # send any queued startup requests (discover/get)
+        for req_type, name in self._pending_startup_requests:
+            if req_type == 'discover':
+                msgs.append({'type': 'discover', 'path': name})
+            elif req_type == 'get':
+                msgs.append({'type': 'get', 'path': name})
+        self._pending_startup_requests.clear()
+        # subscribe, then discover and get to populate schema/state for configured subscriptions
+        for name in self.subscriptions:
+            msgs.append({'type': 'subscribe', 'path': name})
+            msgs.append({'type': 'discover', 'path': name})
+            msgs.append({'type': 'get', 'path': name})
+        # also request schema/state for built-in objects we don't know the schema of yet
+        # (subscribed ones were already requested above)
+        for name in ('laser', 'plasma'):
+            if name in self.cache['schemas'] or name in self.subscriptions:
+                continue
+            msgs.append({'type': 'discover', 'path': name})
+            msgs.append({'type': 'get', 'path': name})
+        self._send_batch(msgs)
 
     def disconnect(self):
+        self._stop_notifier()
+        self._paced_msgs.clear()
         self.reader_running = False
         if self.reader_thread:
             self.reader_thread.join(timeout=0.5)
+        # push out anything still queued (e.g. unsubscribes) before closing
+        self._flush_tx()
         try:
             if self.ser and self.ser.is_open:
                 self.ser.close()
@@ -1211,132 +1416,254 @@ class LiveWatchGUI(QWidget):
         self.connect_btn.setText('Connect')
         self._log('Disconnected')
 
+    def _start_reader(self):
+        # POSIX: let the event loop watch the port fd; Windows COM ports have no
+        # selectable fd, so they keep the reader thread
+        fd = None
+        if os.name == 'posix':
+            try:
+                fd = self.ser.fileno()
+            except (AttributeError, OSError, ValueError):
+                fd = None
+        self._rx_buf.clear()
+        if fd is not None:
+            self._rx_notifier = QSocketNotifier(fd, QSocketNotifier.Read, self)
+            self._rx_notifier.activated.connect(self._on_serial_readable)
+            return
+        self.reader_running = True
+        self.reader_thread = threading.Thread(target=self._reader, daemon=True)
+        self.reader_thread.start()
+
+    def _stop_notifier(self):
+        if self._rx_notifier is not None:
+            self._rx_notifier.setEnabled(False)
+            self._rx_notifier.deleteLater()
+            self._rx_notifier = None
+
+    def _frame_rx(self, data):
+        # append received bytes and return the complete, non-empty lines. The buffer is a
+        # persistent bytearray: lines are located with find() and the consumed prefix is
+        # dropped with a single del, so the tail stays in place without extra copies
+        buf = self._rx_buf
+        buf += data
+        if b'\n' not in data:
+            # still inside a line (the common case for single-byte reads)
+            if len(buf) > 4000:
+                buf.clear()
+            return ()
+        lines = []
+        start = 0
+        while True:
+            nl = buf.find(b'\n', start)
+            if nl < 0:
+                break
+            # lines stay bytes: _loads parses them directly, text is only decoded for the log
+            line = bytes(buf[start:nl]).strip()
+            start = nl + 1
+            if line:
+                lines.append(line)
+        del buf[:start]
+        if len(buf) > 4000:
+            buf.clear()
+        return lines
+
+    def _on_serial_readable(self):
+        # GUI thread (POSIX): read everything available and dispatch complete lines inline
+        try:
+            data = os.read(self._rx_notifier.socket(), 65536)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            self._log('Read error', e)
+            self._stop_notifier()
+            return
+        if not data:
+            # readable with no data: the device went away
+            self._log('Read error', 'port closed')
+            self._stop_notifier()
+            return
+        lines = self._frame_rx(data)
+        q = self._incoming_queue
+        if q.empty():
+            now, later = lines[:RX_BATCH_MAX], lines[RX_BATCH_MAX:]
+        else:
+            # a backlog from an earlier burst is still queued: keep arrival order behind it
+            now, later = (), lines
+        if later:
+            # hand the overflow to the queued path so it is spread over later passes
+            for line in later:
+                q.put(line)
+            if not self._rx_notify_pending:
+                self._rx_notify_pending = True
+                self._incoming_ready.emit()
+        if now:
+            self._dispatch_lines(now)
+
     def _reader(self):
-        buf = ''
+        # reader thread (ports without a selectable fd): frame bytes with the shared
+        # bytearray buffer and hand complete lines to the GUI thread
+        ser = self.ser
         while self.reader_running:
             try:
-                b = self.ser.read()
+                # take everything the driver has buffered in one call; block for a single
+                # byte (up to the port timeout) when nothing is pending
+                n = ser.in_waiting
+                b = ser.read(n) if n else ser.read(1)
             except Exception as e:
                 self._log('Read error', e)
                 break
             if not b:
-                time.sleep(0.01)
                 continue
-            try:
-                ch = b.decode('utf-8')
-            except Exception:
-                continue
-            if ch == '\n':
-                line = buf.strip()
-                buf = ''
-                if line:
-                    # enqueue the received line for processing in the GUI thread
-                    try:
-                        self._incoming_queue.put(line)
-                    except Exception:
-                        pass
-            else:
-                buf += ch
-                if len(buf) > 4000:
-                    buf = ''
+            lines = self._frame_rx(b)
+            if lines:
+                # enqueue the received lines for processing in the GUI thread
+                q = self._incoming_queue
+                for line in lines:
+                    q.put(line)
+                if not self._rx_notify_pending:
+                    self._rx_notify_pending = True
+                    self._incoming_ready.emit()
 
     def _process_incoming(self):
-        # run in GUI thread via QTimer: drain queued serial lines and handle them
-        try:
-            while True:
-                try:
-                    line = self._incoming_queue.get_nowait()
-                except Empty:
-                    break
-                try:
-                    self._handle_message(line)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        # run in GUI thread via _incoming_ready: drain all lines queued by the reader thread
+        # in one pass and dispatch them together. Clear the pending flag before draining so a line queued from now on posts a new signal.
+        self._rx_notify_pending = False
+        lines = []
+        q = self._incoming_queue
+        for _ in range(RX_BATCH_MAX):
+            try:
+                lines.append(q.get_nowait())
+            except Empty:
+                break
+        if lines:
+            self._dispatch_lines(lines)
+        if not q.empty():
+            # more than one batch queued: continue on the next pass, after pending paints
+            self._rx_notify_pending = True
+            self._incoming_ready.emit()
+
+    def _dispatch_lines(self, lines):
+        # coalesce state/update payloads per object, then merge and redraw each object once
+        pending = {}
+        for line in lines:
+            try:
+                self._handle_message(line, pending)
+            except Exception:
+                pass
+        post = self._post_merge
+        if not pending and not post:
+            return
+        self._post_merge = []
+        for name, (replace, payload) in pending.items():
+            self._merge_update_and_refresh(name, payload, replace=replace, record=False)
+        # Type-column updates run after the merges so they see rows created by this batch
+        for fn, args in post:
+            fn(*args)
+
+    def _after_merge(self, pending, fn, *args):
+        # call fn(*args) once the current batch is merged (right away when not batching)
+        if pending is None:
+            fn(*args)
+        else:
+            self._post_merge.append((fn, args))
 
-    def _handle_message(self, line):
-        self._log('RX', line)
+    def _handle_message(self, line, pending=None):
+        """Handle one received line (bytes). State/update payloads are folded into `pending`
+        (see _coalesce_update) when given, otherwise merged immediately.
+        """
+        if self.log_traffic:
+            self._log('RX', line.decode('utf-8', 'replace'))
+        entry = self._repeat_lines.get(line)
+        if entry is not None and entry[1] is not None:
+            # steady-state devices repeat byte-identical lines: reuse the parse but still apply
+            # the message, so history keeps sampling and cells edited locally are put back
+            self._apply_message(_copy_message(entry[1]), line, pending)
+            return
         try:
-            msg = json.loads(line)
+            msg = _loads(line)
         except Exception as e:
-            self._log('Invalid json', e)
+            # bursty firmware may put several frames on one line; parse them in one pass
+            frames = _split_frames(line.decode('utf-8', 'ignore'))
+            if not frames:
+                self._log('Invalid json', e)
+                return
+            for _, msg in frames:
+                if isinstance(msg, dict):
+                    self._apply_message(msg, None, pending)
             return
+        self._apply_message(msg, line, pending)
+
+    def _apply_message(self, msg, line, pending):
+        # act on one parsed message; `line` is its raw source line (None for split frames),
+        # remembered with the parse so a repeat of it can skip _loads
+        subs = self._subscribed()
+        schemas = self.cache['schemas']
+        states = self.cache['states']
         t = msg.get('type')
         if t == 'discover.response':
             if msg.get('found') and 'schema' in msg:
                 s = msg['schema']
                 name = s.get('name')
                 # cache schema but do not display Type until the user subscribes
-                self.cache['schemas'][name] = s
+                schemas[name] = s
                 # if user already subscribed, update Type to 'object'
-                if name in self.subscriptions:
-                    QTimer.singleShot(0, lambda n=name: self._set_expr_type(n, 'object'))
+                if name in subs:
+                    self._after_merge(pending, self._set_expr_type, name, 'object')
         elif t == 'subscribe.response':
             name = msg.get('path')
             # subscription confirmed by device — do not overwrite the object's Type column
             # keep Type showing the object's kind (object/state). If we know the schema, mark 'object', otherwise 'state' if we have state cached.
             # mark type only for subscribed objects; if schema already known, mark 'object', else mark 'state' until discover arrives
             def _mark_sub_type(n):
-                if n in self.cache.get('schemas', {}):
+                if n in schemas:
                     self._set_expr_type_if_exists(n, 'object')
-                elif n in self.cache.get('states', {}):
+                elif n in states:
                     self._set_expr_type_if_exists(n, 'state')
-            QTimer.singleShot(0, lambda n=name: _mark_sub_type(n))
+            self._after_merge(pending, _mark_sub_type, name)
         elif t == 'unsubscribe.response':
             name = msg.get('path')
             # device confirmed unsubscribe — remove locally and clear expecting
-            try:
-                if name in self.subscriptions:
-                    self.subscriptions.remove(name)
-            except Exception:
-                pass
-            try:
-                if name in self.expecting:
-                    del self.expecting[name]
-            except Exception:
-                pass
-            QTimer.singleShot(0, lambda n=name: self._set_expr_type_if_exists(n, 'unsubscribed'))
+            self._remove_sub(name)
+            self.expecting.pop(name, None)
+            self._after_merge(pending, self._set_expr_type_if_exists, name, 'unsubscribed')
             self._log('Device confirmed unsubscribe for', name)
         elif t == 'state':
             name = msg.get('path')
             # show scalar value or store/merge changes
             if 'value' in msg:
                 # replace cached state with full snapshot and refresh UI
-                self._merge_update_and_refresh(name, msg['value'], replace=True)
+                self._coalesce_update(pending, name, msg['value'], replace=True)
+                self._remember_parsed_line(line, msg)
                 # set Type only if subscribed: if subscribed+schema -> 'object', if subscribed but no schema -> 'state'
                 def _choose_type(n):
-                    if n in self.subscriptions:
-                        if n in self.cache.get('schemas', {}):
+                    if n in subs:
+                        if n in schemas:
                             self._set_expr_type_if_exists(n, 'object')
                         else:
                             self._set_expr_type_if_exists(n, 'state')
                     else:
                         # do not show type for unsubscribed objects
                         self._set_expr_type_if_exists(n, '')
-                QTimer.singleShot(0, lambda n=name: _choose_type(n))
+                self._after_merge(pending, _choose_type, name)
             elif 'changes' in msg:
                 # merge partial changes into cache and refresh
-                self._merge_update_and_refresh(name, msg['changes'], replace=False)
+                self._coalesce_update(pending, name, msg['changes'])
+                self._remember_parsed_line(line, msg)
         elif t == 'update':
             name = msg.get('path')
             # ignore unsolicited updates unless subscribed (user requested this)
             require = self.require_sub_chk.isChecked()
             # allow updates if we recently asked for this object's state/schema
-            now = time.time()
-            expected_until = self.expecting.get(name, 0)
-            if require and name not in self.subscriptions and expected_until < now:
+            # (the clock is only read for unsubscribed objects)
+            if require and name not in subs and self.expecting.get(name, 0) < time.monotonic():
                 self._log('Ignored unsolicited update for', name)
                 return
             if 'changes' in msg:
                 # merge partial changes into cache and refresh
                 # clear expecting flag if this was a response
-                if name in self.expecting:
-                    try:
-                        del self.expecting[name]
-                    except Exception:
-                        pass
-                self._merge_update_and_refresh(name, msg['changes'], replace=False)
+                self.expecting.pop(name, None)
+                self._coalesce_update(pending, name, msg['changes'])
+                self._remember_parsed_line(line, msg)
         else:
             # other messages - ignore by default
             pass
@@ -1347,12 +1674,12 @@ class LiveWatchGUI(QWidget):
             QMessageBox.warning(self, 'No object', 'Type an object name to discover')
             return
         # Request schema (discover) first, then request state (get).
-        req_disc = {'id': 'discover-'+name, 'type': 'discover', 'path': name}
+        req_disc = {'type': 'discover', 'path': name}
         self._send(req_disc)
         # small delay then ask for state so GUI shows fields and values
-        QTimer.singleShot(50, lambda n=name: self._send({'id': 'get-'+n, 'type': 'get', 'path': n}))
+        QTimer.singleShot(50, lambda n=name: self._send({'type': 'get', 'path': n}))
         # remember object in config
-        self._save_config()
+        self._schedule_save()
 
     def on_subscribe(self):
         name = self.object_input.text().strip()
@@ -1360,80 +1687,151 @@ class LiveWatchGUI(QWidget):
             QMessageBox.warning(self, 'No object', 'Type an object name to subscribe')
             return
         # add to subscription list and send subscribe request
-        self.subscriptions.add(name)
-        req = {'id': 'sub-'+name, 'type': 'subscribe', 'path': name}
+        self._add_sub(name)
+        req = {'type': 'subscribe', 'path': name}
         self._send(req)
-        self._save_config()
+        self._schedule_save()
         self._log('Subscribed to', name)
         # request schema then immediate state so the object appears in the tree
-        self._send({'id': 'discover-'+name, 'type': 'discover', 'path': name})
-        QTimer.singleShot(100, lambda n=name: self._send({'id': 'get-'+n, 'type':'get', 'path': n}))
+        self._send({'type': 'discover', 'path': name})
+        QTimer.singleShot(100, lambda n=name: self._send({'type':'get', 'path': n}))
 
     def on_unsubscribe(self):
         name = self.object_input.text().strip()
         if not name:
             QMessageBox.warning(self, 'No object', 'Type an object name to unsubscribe')
             return
-        if name in self.subscriptions:
-            self.subscriptions.remove(name)
+        self._remove_sub(name)
         # also clear any short-lived expecting window so updates are ignored immediately
-        try:
-            if name in self.expecting:
-                del self.expecting[name]
-        except Exception:
-            pass
-        req = {'id': 'unsub-'+name, 'type': 'unsubscribe', 'path': name}
+        self.expecting.pop(name, None)
+        req = {'type': 'unsubscribe', 'path': name}
         self._send(req)
-        self._save_config()
+        self._schedule_save()
         self._log('Unsubscribed from', name)
 
-    def _send(self, obj):
+    def _send(self, obj, flush=False):
+        """Queue one message for the serial port, stamping it with the next request id.
+        Messages are collected in _tx_buf and written with a single write() once control
+        returns to the event loop (or immediately when flush=True or the buffer is large).
+        """
         if not self.ser or not self.ser.is_open:
             self._log('Not connected')
             return
         try:
-            s = json.dumps(obj, separators=(',',':')) + '\n'
-            self.ser.write(s.encode('utf-8'))
+            obj['id'] = next(self._msg_ids)
+            buf = _dumps_line(obj)
+            self._tx_buf += buf
+            if flush or len(self._tx_buf) >= TX_FLUSH_BYTES:
+                self._flush_tx()
+            elif not self._tx_flush_scheduled:
+                self._tx_flush_scheduled = True
+                QTimer.singleShot(0, self._flush_tx)
             # if this is a discover/get/subscribe for a path, accept responses briefly
             try:
                 t = obj.get('type')
                 p = obj.get('path')
                 if t in ('discover','get','subscribe') and p:
-                    self.expecting[p] = time.time() + 3.0
+                    self.expecting[p] = time.monotonic() + 3.0
             except Exception:
                 pass
-            self._log('TX', s.strip())
+            if self.log_traffic:
+                # decode for display only when traffic is being logged
+                self._log('TX', buf[:-1].decode('utf-8'))
+        except Exception as e:
+            self._log('Send error', e)
+
+    def _add_sub(self, name):
+        self.subscriptions.add(name)
+        self._subs_snapshot = None
+
+    def _remove_sub(self, name):
+        self.subscriptions.discard(name)
+        self._subs_snapshot = None
+
+    def _subscribed(self):
+        snap = self._subs_snapshot
+        if snap is None:
+            snap = self._subs_snapshot = frozenset(self.subscriptions)
+        return snap
+
+    def _expire_expecting(self):
+        if self.expecting:
+            now = time.monotonic()
+            self.expecting = {k: t for k, t in self.expecting.items() if t >= now}
+
+    def _send_batch(self, msgs):
+        # send messages in writes of at most TX_PACED_BYTES, one write per TX_PACE_MS tick,
+        # so the device is never handed more than its RX FIFO holds while it is replying
+        if not msgs:
+            return
+        self._paced_msgs.extend(msgs)
+        if not self._pace_scheduled:
+            self._send_paced()
+
+    def _send_paced(self):
+        self._pace_scheduled = False
+        q = self._paced_msgs
+        if not self.ser or not self.ser.is_open:
+            q.clear()
+            return
+        # anything already queued by _send goes out on its own so it doesn't add to this write
+        self._flush_tx()
+        size = 0
+        while q:
+            # the id that _send stamps on adds up to about a dozen bytes
+            n = len(_dumps_line(q[0])) + 12
+            if size and size + n > TX_PACED_BYTES:
+                break
+            self._send(q.popleft())
+            size += n
+        self._flush_tx()
+        if q:
+            self._pace_scheduled = True
+            QTimer.singleShot(TX_PACE_MS, self._send_paced)
+
+    def _flush_tx(self):
+        # write everything queued by _send in one call
+        self._tx_flush_scheduled = False
+        if not self._tx_buf:
+            return
+        buf = self._tx_buf
+        self._tx_buf = bytearray()
+        if not self.ser or not self.ser.is_open:
+            return
+        try:
+            self.ser.write(buf)
         except Exception as e:
             self._log('Send error', e)
 
     def _show_schema(self, name, schema):
         # normalize to top-level object name
-        obj, _ = self._split_path(name)
-        items = self.tree.findItems(obj, Qt.MatchExactly, 0)
-        if items:
-            item = items[0]
-            # keep existing children but clear types/values to rebuild schema view
+        obj = name.partition('.')[0]
+        item = self._tree_index.get(obj)
+        if item is not None:
+            # keep existing children but clear types/values to rebuild schema view; the removed
+            # items leave _tree_fields below
             item.takeChildren()
         else:
-            item = QTreeWidgetItem([obj, 'object'])
-            self.tree.addTopLevelItem(item)
+            item = self._ensure_object_item(obj, 'object')
         fields = schema.get('fields', [])
+        children = []
         for f in fields:
             # show field name and type (value will be filled by state)
             fi = QTreeWidgetItem([f.get('name','?'), f.get('type','?')])
-            fi.setFlags(fi.flags() | Qt.ItemIsEditable)
-            item.addChild(fi)
+            fi.setFlags(_LEAF_FLAGS)
+            fi.setData(0, _OBJ_ROLE, obj)
+            children.append(fi)
+        item.addChildren(children)
+        # the old children are gone; index the new ones for _set_field_item_value
+        self._tree_fields[obj] = {fi.text(0): fi for fi in children}
         item.setExpanded(True)
 
     def _show_state(self, name, state):
         # Accept both 'object' or 'object.field' paths
-        obj, parts = self._split_path(name)
-        items = self.tree.findItems(obj, Qt.MatchExactly, 0)
-        if items:
-            item = items[0]
-        else:
-            item = QTreeWidgetItem([obj, 'state'])
-            self.tree.addTopLevelItem(item)
+        obj, _, rest = name.partition('.')
+        item = self._ensure_object_item(obj)
+        # array containers stay folded when the object is first expanded below
+        folded = []
 
         # If state is a dict (full state), update or create children accordingly
         if isinstance(state, dict):
@@ -1446,30 +1844,50 @@ class LiveWatchGUI(QWidget):
                 if isinstance(v, list):
                     # create container child
                     container = self._set_field_item_value(obj, k, '<array>')
-                    # clear children
-                    container.takeChildren()
-                    total = len(v)
-                    # add items and a 'load more' if needed; here we show first 50
+                    folded.append(container)
+                    # only one window of 50 elements is kept in the tree; 'Show previous' and
+                    # 'Load more' move it instead of appending. The device always replies with the
+                    # whole array, so the window is cut from it here. Built up front and attached
+                    # with one addChildren call
                     chunk = 50
-                    for i, val in enumerate(v[:chunk]):
-                        child = QTreeWidgetItem([str(i), str(val)])
-                        container.addChild(child)
-                    if total > chunk:
-                        more = QTreeWidgetItem([f'Load more (0..{chunk-1})', f'{chunk}/{total}'])
+                    total = len(v)
+                    start = self._array_windows.get((obj, k), 0)
+                    if start >= total:
+                        # the array shrank below the window
+                        start = 0
+                    end = min(start + chunk, total)
+                    children = [QTreeWidgetItem([str(i), _fmt_value(v[i])]) for i in range(start, end)]
+                    if start > 0:
+                        prev = max(start - chunk, 0)
+                        back = QTreeWidgetItem([f'Show previous ({prev}..{start - 1})', f'{start}/{total}'])
+                        back.setData(0, Qt.UserRole, {'obj': obj, 'field': k, 'offset': prev, 'limit': chunk, 'total': total})
+                        children.insert(0, back)
+                    if total > end:
+                        more = QTreeWidgetItem([f'Load more ({end}..{min(end + chunk, total) - 1})', f'{end}/{total}'])
                         # store metadata
-                        more.setData(0, Qt.UserRole, {'obj': obj, 'field': k, 'offset': chunk, 'limit': chunk, 'total': total})
-                        container.addChild(more)
+                        more.setData(0, Qt.UserRole, {'obj': obj, 'field': k, 'offset': end, 'limit': chunk, 'total': total})
+                        children.append(more)
+                    with _bulk_update(self.tree):
+                        # clear children
+                        container.takeChildren()
+                        container.addChildren(children)
                 else:
                     self._set_field_item_value(obj, k, v)
         else:
             # scalar state: if path included field parts, set that field; otherwise set top-level value
-            if parts:
-                field_name = parts[-1]
+            if rest:
+                field_name = rest.rpartition('.')[2]
                 self._set_field_item_value(obj, field_name, state)
             else:
                 # set top-level display value
-                item.setText(1, str(state))
-        item.setExpanded(True)
+                item.setText(1, _fmt_value(state))
+        # the first state expands the whole object in one recursive call instead of one per
+        # nested struct; after that whatever the user expanded or collapsed is left alone
+        if obj not in self._tree_expanded:
+            self._tree_expanded.add(obj)
+            self.tree.expandRecursively(self.tree.indexFromItem(item))
+            for container in folded:
+                self.tree.collapseItem(container)
 
     def _on_load_more(self, meta):
         # meta contains obj, field, offset, limit
@@ -1477,60 +1895,55 @@ class LiveWatchGUI(QWidget):
         field = meta.get('field')
         offset = meta.get('offset', 0)
         limit = meta.get('limit', 50)
+        # the next state for this array shows the window [offset, offset + limit)
+        self._array_windows[(obj, field)] = offset
         # request slice from device
         path = f'{obj}'
-        req = {'id': f'get-{obj}-{field}-{offset}', 'type': 'get', 'path': path, 'offset': offset, 'limit': limit}
+        req = {'type': 'get', 'path': path, 'offset': offset, 'limit': limit}
         self._send(req)
         self._log('Requested slice', obj, field, offset, limit)
 
-    def _split_path(self, path):
-        # returns (top_level_object, [subpath parts])
-        if not path:
-            return ('', [])
-        parts = path.split('.')
-        return (parts[0], parts[1:])
-
     def _set_field_item_value(self, obj_name, field_name, value):
         # ensure top-level object
-        items = self.tree.findItems(obj_name, Qt.MatchExactly, 0)
-        if items:
-            obj_item = items[0]
-        else:
-            obj_item = QTreeWidgetItem([obj_name, 'state'])
-            self.tree.addTopLevelItem(obj_item)
-        # search for existing child
-        for i in range(obj_item.childCount()):
-            ch = obj_item.child(i)
-            if ch.text(0) == field_name:
-                ch.setText(1, str(value))
-                return ch
+        obj_item = self._ensure_object_item(obj_name)
+        fields = self._tree_fields.setdefault(obj_name, {})
+        ch = fields.get(field_name)
+        if ch is not None:
+            self._applying_server_update = True
+            try:
+                ch.setData(1, _VALUE_ROLE, value)
+                ch.setText(1, _fmt_value(value))
+            finally:
+                self._applying_server_update = False
+            return ch
         # not found, create
-        fi = self._create_field_item(field_name, value)
+        fi = self._create_field_item(field_name, value, obj_name)
         obj_item.addChild(fi)
+        fields[field_name] = fi
         return fi
 
     def _mark_unsolicited(self, obj_name):
         # visually mark an object as coming from unsolicited update
-        items = self.tree.findItems(obj_name, Qt.MatchExactly, 0)
-        if not items:
+        obj_item = self._tree_index.get(obj_name)
+        if obj_item is None:
             return
-        obj_item = items[0]
         # gray out the object's text
-        obj_item.setForeground(0, QColor('gray'))
+        obj_item.setForeground(0, _GRAY)
         obj_item.setToolTip(0, 'Unsolicited data (not subscribed)')
-        # also mark children
-        for i in range(obj_item.childCount()):
-            ch = obj_item.child(i)
-            ch.setForeground(0, QColor('gray'))
-            ch.setForeground(1, QColor('gray'))
+        # also mark children, taken from the field index rather than walking the item
+        for ch in self._tree_fields.get(obj_name, {}).values():
+            ch.setForeground(0, _GRAY)
+            ch.setForeground(1, _GRAY)
             ch.setToolTip(0, 'Unsolicited field value')
 
-    def _ensure_object_item(self, name):
-        items = self.tree.findItems(name, Qt.MatchExactly, 0)
-        if items:
-            return items[0]
-        it = QTreeWidgetItem([name, 'state'])
+    def _ensure_object_item(self, name, typ='state'):
+        # top-level items are looked up through _tree_index instead of scanning with findItems
+        it = self._tree_index.get(name)
+        if it is not None:
+            return it
+        it = QTreeWidgetItem([name, typ])
         self.tree.addTopLevelItem(it)
+        self._tree_index[name] = it
         return it
 
     def on_add_object(self):
@@ -1540,9 +1953,10 @@ class LiveWatchGUI(QWidget):
             return
         self._ensure_object_item(name)
         self._log('Added object placeholder', name)
-        # automatically request schema and state for newly added object
-        self._send({'id': 'discover-'+name, 'type': 'discover', 'path': name})
-        QTimer.singleShot(50, lambda n=name: self._send({'id': 'get-'+n, 'type': 'get', 'path': n}))
+        # automatically request schema and state for newly added object; both go out
+        # back to back in the same TX flush, the distinct ids keep the replies apart
+        self._send({'type': 'discover', 'path': name})
+        self._send({'type': 'get', 'path': name})
 
     def on_item_expanded(self, item):
         # Only act for top-level objects
@@ -1551,7 +1965,7 @@ class LiveWatchGUI(QWidget):
         name = item.text(0)
         # If we have no cached state or the item has no children, request state
         if name not in self.cache.get('states', {}) or item.childCount() == 0:
-            req = {'id': f'get-{name}', 'type': 'get', 'path': name}
+            req = {'type': 'get', 'path': name}
             self._send(req)
             self._log('Requested state for', name)
 
@@ -1560,60 +1974,87 @@ class LiveWatchGUI(QWidget):
         if isinstance(data, dict) and 'obj' in data:
             self._on_load_more(data)
 
-    def _create_field_item(self, key, val):
-        # if val is a dict/struct create nested children
-        if isinstance(val, dict):
-            fi = QTreeWidgetItem([key, 'struct'])
-            for k, v in val.items():
-                child = self._create_field_item(k, v)
-                fi.addChild(child)
-            fi.setExpanded(True)
-            return fi
-        else:
-            vstr = str(val)
-            fi = QTreeWidgetItem([key, vstr])
-            # make value column editable so user can change it
-            fi.setFlags(fi.flags() | Qt.ItemIsEditable)
+    def _create_field_item(self, key, val, obj_name=None):
+        # dicts/structs become nested children, built with an explicit stack rather than
+        # recursion; the result is expanded together with the rest of the object by _show_state.
+        # Every item remembers obj_name so edits don't have to walk up to the object.
+        def make(k, v):
+            if isinstance(v, dict):
+                fi = QTreeWidgetItem([k, 'struct'])
+            else:
+                fi = QTreeWidgetItem([k, _fmt_value(v)])
+                fi.setData(1, _VALUE_ROLE, v)
+                # make value column editable so user can change it
+                fi.setFlags(_LEAF_FLAGS)
+            if obj_name is not None:
+                fi.setData(0, _OBJ_ROLE, obj_name)
             return fi
 
+        root = make(key, val)
+        stack = [(root, val)] if isinstance(val, dict) else []
+        while stack:
+            parent, v = stack.pop()
+            children = []
+            for k, sub in v.items():
+                child = make(k, sub)
+                children.append(child)
+                if isinstance(sub, dict):
+                    stack.append((child, sub))
+            parent.addChildren(children)
+        return root
+
     def on_item_changed(self, item, column):
-        # only act when value column changed (column 1) and item has a parent (field)
-        if column != 1:
+        # only act when value column changed (column 1) and item has a parent (field);
+        # values written from device data are not user edits
+        if column != 1 or self._applying_server_update:
             return
         parent = item.parent()
         if not parent:
             return
-        # find object name as top-level ancestor
-        obj = parent
-        while obj.parent() is not None:
-            obj = obj.parent()
-        obj_name = obj.text(0)
+        obj_name = self._object_name(item)
         field_name = item.text(0)
         new_val_str = item.text(1)
+        # QTreeWidgetItem keeps one text for display and editing, so the editor starts from the
+        # rounded text; committing it unchanged must not send the rounded value back
+        if new_val_str == _fmt_value(item.data(1, _VALUE_ROLE)):
+            return
         # try to coerce to number or boolean
         new_val = self._coerce_value(new_val_str)
         # send set message
-        msg = {'id': f'set-{obj_name}-{field_name}', 'type': 'set', 'path': obj_name, 'changes': {field_name: new_val}}
+        msg = {'type': 'set', 'path': obj_name, 'changes': {field_name: new_val}}
         self._send(msg)
         self._log('Sent set for', obj_name, field_name, '->', new_val)
 
     def _coerce_value(self, s):
-        if s.lower() in ('true','false'):
-            return s.lower() == 'true'
-        try:
-            if '.' in s:
-                return float(s)
-            return int(s)
-        except Exception:
-            return s
+        # edited text -> JSON value: true/false/null, int, float, otherwise the string itself
+        t = s.strip()
+        lit = t.lower()
+        if lit in _LITERALS:
+            return _LITERALS[lit]
+        if _INT_RE.fullmatch(t):
+            return int(t)
+        if _FLOAT_RE.fullmatch(t):
+            return float(t)
+        return s
+
+    def _object_name(self, item):
+        # name of the object a field item belongs to; stored on the item when it was built,
+        # otherwise found by walking up to the top-level item
+        name = item.data(0, _OBJ_ROLE)
+        if name is None:
+            while item.parent() is not None:
+                item = item.parent()
+            name = item.text(0)
+        return name
 
     def on_context_menu(self, pos):
         item = self.tree.itemAt(pos)
         if not item:
             return
-        parent = item.parent()
-        if not parent:
+        if item.parent() is None:
             return
+        obj_name = self._object_name(item)
+        field_name = item.text(0)
         # show simple menu with Delete Field
         from PySide6.QtWidgets import QMenu
         menu = QMenu(self)
@@ -1621,14 +2062,8 @@ class LiveWatchGUI(QWidget):
         act_hist = menu.addAction('Show history')
         action = menu.exec(self.tree.viewport().mapToGlobal(pos))
         if action == act_del:
-            # find object and field
-            obj = parent
-            while obj.parent() is not None:
-                obj = obj.parent()
-            obj_name = obj.text(0)
-            field_name = item.text(0)
             # send delete request
-            msg = {'id': f'del-{obj_name}-{field_name}', 'type': 'delete', 'path': obj_name, 'field': field_name}
+            msg = {'type': 'delete', 'path': obj_name, 'field': field_name}
             self._send(msg)
             self._log('Sent delete for', obj_name, field_name)
         elif action == act_hist:
@@ -1640,8 +2075,16 @@ class LiveWatchGUI(QWidget):
             ly = QVBoxLayout(d)
             te = QTextEdit()
             te.setReadOnly(True)
+            # build the whole text first and set it once; samples in the same second share a stamp
+            stamps = {}
+            lines = []
             for ts, val in hist:
-                te.append(f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))}: {val}")
+                sec = int(ts)
+                stamp = stamps.get(sec)
+                if stamp is None:
+                    stamp = stamps[sec] = time.strftime(HISTORY_TIME_FMT, time.localtime(sec))
+                lines.append(f'{stamp}: {val}')
+            te.setPlainText('\n'.join(lines))
             ly.addWidget(te)
             d.resize(400,300)
             d.exec()